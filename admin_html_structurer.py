@@ -16,15 +16,134 @@ Examples:
 """
 
 import re
-import json
 import argparse
-from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 from typing import List, Dict, Optional, Any
 from abc import ABC, abstractmethod
-import requests
-from bs4 import BeautifulSoup
-import time
+import lxml.html
+from lxml import etree
+
+from scraper_utils import HostLimiter, build_session, dumps_indented, json_loads
+
+
+logger = logging.getLogger(__name__)
+
+# Patterns are compiled once at import instead of per call/per event element
+_FREE_RE = re.compile(r'\b(free|no charge|complimentary)\b', re.I)
+_PRICE_RE = re.compile(r'\$?(\d+(?:\.\d{2})?)')
+_DOLLAR_RE = re.compile(r'\$\d+(?:\.\d{2})?')
+_ISO_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')  # 2025-01-15
+_US_DATE_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})')  # 01/15/2025
+_MONTH_DATE_RE = re.compile(r'(\w+)\s+(\d{1,2}),?\s+(\d{4})')  # January 15, 2025 / Jan 15, 2025
+_MONTHS = {
+    'january': 1, 'jan': 1,
+    'february': 2, 'feb': 2,
+    'march': 3, 'mar': 3,
+    'april': 4, 'apr': 4,
+    'may': 5,
+    'june': 6, 'jun': 6,
+    'july': 7, 'jul': 7,
+    'august': 8, 'aug': 8,
+    'september': 9, 'sept': 9, 'sep': 9,
+    'october': 10, 'oct': 10,
+    'november': 11, 'nov': 11,
+    'december': 12, 'dec': 12,
+}
+_DATE_IN_TEXT_RE = re.compile(r'(\w+\s+\d{1,2},?\s+\d{4})')
+
+# Keyword -> category lookup for _infer_category; categories are listed in
+# priority order so the earliest one wins when several keywords appear
+_CATEGORY_KEYWORDS = {
+    'music': ['concert', 'music', 'band', 'dj', 'jazz', 'rock'],
+    'food': ['food', 'restaurant', 'dining', 'tasting', 'brunch'],
+    'arts': ['art', 'gallery', 'exhibit', 'museum', 'theater', 'play'],
+    'sports': ['sports', 'game', 'match', 'race', 'tournament'],
+    'outdoor': ['outdoor', 'park', 'hike', 'nature', 'trail'],
+    'education': ['workshop', 'class', 'seminar', 'education', 'learning'],
+}
+_CATEGORY_PRIORITY = list(_CATEGORY_KEYWORDS)
+_KEYWORD_TO_CATEGORY = {
+    word: category
+    for category, words in _CATEGORY_KEYWORDS.items()
+    for word in words
+}
+# Zero-width lookahead finds every (possibly overlapping) substring hit in a
+# single scan, matching the old `word in text` semantics
+_CATEGORY_RE = re.compile(
+    '(?=(' + '|'.join(sorted(map(re.escape, _KEYWORD_TO_CATEGORY), key=len, reverse=True)) + '))',
+    re.I
+)
+
+
+def _tag_xpath(tags: str, *class_words: str, first: bool = False) -> etree.XPath:
+    """
+    Compile an XPath selecting descendants by tag and class
+
+    Class checks are case-sensitive substring matches on the class
+    attribute, like matching each class against a regex
+
+    Args:
+        tags: Space-separated tag names to select
+        class_words: Substrings, one of which the class must contain (any
+            element of the given tags matches when none are given)
+        first: Select only the first match in document order
+
+    Returns:
+        Compiled XPath
+    """
+    path = './/*[%s]' % ' or '.join(f'self::{tag}' for tag in tags.split())
+    if class_words:
+        path += '[%s]' % ' or '.join(f"contains(@class, '{word}')" for word in class_words)
+    return etree.XPath(f'({path})[1]' if first else path)
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching elements that carry the given class, like CSS .name"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Element lookups run as precompiled XPath, evaluated in C by lxml
+_JSON_LD_XPATH = etree.XPath("//script[@type='application/ld+json']")
+_LINK_XPATH = etree.XPath('(.//a[@href])[1]')
+# Visible text nodes (script/style contents excluded)
+_TEXT_XPATH = etree.XPath('.//text()[not(parent::script or parent::style)]', smart_strings=False)
+
+
+def _first(xpath: etree.XPath, element) -> Optional[Any]:
+    """Return the first node an XPath selects under element, or None"""
+    found = xpath(element)
+    return found[0] if found else None
+
+
+def _strings(element) -> List[str]:
+    """An element's stripped, non-empty text nodes, in document order"""
+    return [text for text in map(str.strip, _TEXT_XPATH(element)) if text]
+
+
+def _text(element, separator: str = '') -> str:
+    """Join an element's stripped, non-empty text nodes with separator"""
+    return separator.join(_strings(element))
+
+
+# Serializes console output from parsers running on worker threads
+_print_lock = threading.Lock()
+
+
+def _print(*args, **kwargs):
+    """Thread-safe print so output from concurrent scrapes doesn't interleave"""
+    with _print_lock:
+        print(*args, **kwargs)
+
+
+# One pooled keep-alive session shared by every parser
+_SESSION = build_session(pool_connections=16, pool_maxsize=32)
+
+_HOST_LIMITER = HostLimiter()
 
 
 @dataclass
@@ -56,7 +175,9 @@ class Event:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        # Fields are flat (str/float/bool/list of str), so a shallow projection
+        # of __dict__ is enough and avoids asdict()'s recursive deep copy
+        return {k: v for k, v in self.__dict__.items() if v is not None}
 
 
 class SourceParser(ABC):
@@ -70,14 +191,28 @@ class SourceParser(ABC):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
 
-    def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
-        """Fetch and parse a web page"""
+    def fetch_html(self, url: str) -> Optional[bytes]:
+        """Fetch a web page and return its raw (undecoded) markup"""
+        _HOST_LIMITER.wait(url)
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = _SESSION.get(url, headers=self.headers, timeout=10)
             response.raise_for_status()
-            return BeautifulSoup(response.text, 'lxml')
+            # Hand lxml the bytes so it sniffs <meta charset> itself instead of
+            # requests running its pure-Python charset detection over the body
+            return response.content
         except Exception as e:
-            print(f"Error fetching {url}: {e}")
+            _print(f"Error fetching {url}: {e}")
+            return None
+
+    def fetch_page(self, url: str) -> Optional[lxml.html.HtmlElement]:
+        """Fetch and parse a web page"""
+        html = self.fetch_html(url)
+        if not html:
+            return None
+        try:
+            return lxml.html.fromstring(html)
+        except (ValueError, etree.ParserError) as e:
+            _print(f"Error parsing {url}: {e}")
             return None
 
     @abstractmethod
@@ -91,11 +226,11 @@ class SourceParser(ABC):
             return 0.0
 
         # Handle free events
-        if re.search(r'\b(free|no charge|complimentary)\b', price_text, re.I):
+        if _FREE_RE.search(price_text):
             return 0.0
 
         # Extract first numeric value
-        match = re.search(r'\$?(\d+(?:\.\d{2})?)', price_text)
+        match = _PRICE_RE.search(price_text)
         return float(match.group(1)) if match else 0.0
 
     def categorize_price(self, price: float) -> str:
@@ -114,64 +249,72 @@ class SourceParser(ABC):
         if not date_str:
             return None
 
-        # Common date patterns
-        patterns = [
-            (r'(\d{4})-(\d{2})-(\d{2})', '%Y-%m-%d'),  # 2025-01-15
-            (r'(\d{1,2})/(\d{1,2})/(\d{4})', '%m/%d/%Y'),  # 01/15/2025
-            (r'(\w+)\s+(\d{1,2}),?\s+(\d{4})', '%B %d %Y'),  # January 15, 2025
-            (r'(\w{3})\s+(\d{1,2}),?\s+(\d{4})', '%b %d %Y'),  # Jan 15, 2025
-        ]
+        if match := _ISO_DATE_RE.search(date_str):
+            return match.group(0)
 
-        for pattern, fmt in patterns:
+        # Build YYYY-MM-DD straight from the captured groups; date() still
+        # rejects impossible days the way strptime did
+        if match := _US_DATE_RE.search(date_str):
+            month, day, year = match.groups()
             try:
-                if match := re.search(pattern, date_str):
-                    if fmt == '%Y-%m-%d':
-                        return match.group(0)
-                    else:
-                        # Parse and reformat
-                        parsed = datetime.strptime(match.group(0), fmt)
-                        return parsed.strftime('%Y-%m-%d')
-            except:
+                return date(int(year), int(month), int(day)).isoformat()
+            except ValueError:
+                pass
+
+        for match in _MONTH_DATE_RE.finditer(date_str):
+            month_name, day, year = match.groups()
+            try:
+                return date(int(year), _MONTHS[month_name.lower()], int(day)).isoformat()
+            except (ValueError, KeyError):
                 continue
 
         return None
 
-    def extract_from_json_ld(self, soup: BeautifulSoup) -> List[Event]:
+    def extract_from_json_ld(self, tree: lxml.html.HtmlElement, now_iso: Optional[str] = None) -> List[Event]:
         """Extract events from JSON-LD structured data"""
         events = []
+        now_iso = now_iso or datetime.now().isoformat()
 
-        for script in soup.find_all('script', type='application/ld+json'):
+        for script in _JSON_LD_XPATH(tree):
+            if not script.text:
+                continue
             try:
-                data = json.loads(script.string)
+                data = json_loads(script.text)
 
                 # Handle single event or list of events
                 items = data if isinstance(data, list) else [data]
 
                 for item in items:
                     if item.get('@type') == 'Event':
-                        events.append(self._create_event_from_json_ld(item))
-            except Exception as e:
-                print(f"Error parsing JSON-LD: {e}")
+                        events.append(self._create_event_from_json_ld(item, now_iso))
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                logger.debug("Skipping JSON-LD block: %s", e)
                 continue
 
         return events
 
-    def _create_event_from_json_ld(self, data: Dict) -> Event:
+    def _create_event_from_json_ld(self, data: Dict, now_iso: Optional[str] = None) -> Event:
         """Create Event from JSON-LD data"""
+        name = data.get('name', 'Untitled Event')
+        loc = data.get('location')
+        loc_is_dict = bool(loc) and isinstance(loc, dict)
+
         # Extract location
         location = self.location
-        if loc := data.get('location'):
-            if isinstance(loc, dict):
-                address = loc.get('address', {})
-                if isinstance(address, str):
-                    location = address
-                elif isinstance(address, dict):
-                    location = f"{address.get('streetAddress', '')}, {address.get('addressLocality', '')}, FL"
+        if loc_is_dict:
+            address = loc.get('address', {})
+            if isinstance(address, str):
+                location = address
+            elif isinstance(address, dict):
+                location = f"{address.get('streetAddress', '')}, {address.get('addressLocality', '')}, FL"
 
         # Extract date/time
         start = data.get('startDate', '')
-        date_str = start.split('T')[0] if 'T' in start else start
-        time_str = start.split('T')[1][:5] if 'T' in start else 'evening'
+        if 'T' in start:
+            date_str, _, rest = start.partition('T')
+            time_str = rest[:5]
+        else:
+            date_str, time_str = start, 'evening'
 
         # Extract price
         price = 0.0
@@ -186,14 +329,13 @@ class SourceParser(ABC):
         if performer := data.get('performer'):
             if isinstance(performer, dict):
                 venue = performer.get('name', venue)
-        if loc := data.get('location'):
-            if isinstance(loc, dict):
-                venue = loc.get('name', venue)
+        if loc_is_dict:
+            venue = loc.get('name', venue)
 
         return Event(
-            name=data.get('name', 'Untitled Event'),
+            name=name,
             venue=venue,
-            category=self._infer_category(data.get('name', '')),
+            category=self._infer_category(name),
             description=data.get('description', '')[:500],
             location=location,
             date=date_str,
@@ -209,33 +351,35 @@ class SourceParser(ABC):
             externalLink=data.get('url', self.base_url),
             source=self.source_name,
             sourceUrl=self.base_url,
-            submittedAt=datetime.now().isoformat(),
+            submittedAt=now_iso or datetime.now().isoformat(),
             status='pending'
         )
 
+    @staticmethod
+    def _event_key(name: str, date_str: str) -> tuple:
+        """Identity used to drop duplicate listings of the same event"""
+        return (name.lower().strip(), date_str)
+
     def _infer_category(self, text: str) -> str:
         """Infer event category from text"""
-        text_lower = text.lower()
-
-        if any(word in text_lower for word in ['concert', 'music', 'band', 'dj', 'jazz', 'rock']):
-            return 'music'
-        elif any(word in text_lower for word in ['food', 'restaurant', 'dining', 'tasting', 'brunch']):
-            return 'food'
-        elif any(word in text_lower for word in ['art', 'gallery', 'exhibit', 'museum', 'theater', 'play']):
-            return 'arts'
-        elif any(word in text_lower for word in ['sports', 'game', 'match', 'race', 'tournament']):
-            return 'sports'
-        elif any(word in text_lower for word in ['outdoor', 'park', 'hike', 'nature', 'trail']):
-            return 'outdoor'
-        elif any(word in text_lower for word in ['workshop', 'class', 'seminar', 'education', 'learning']):
-            return 'education'
-        else:
-            return 'community'
+        found = {_KEYWORD_TO_CATEGORY[word.lower()] for word in _CATEGORY_RE.findall(text)}
+        for category in _CATEGORY_PRIORITY:
+            if category in found:
+                return category
+        return 'community'
 
 
 class OrangeCountyParksParser(SourceParser):
     """Parser for Orange County Parks & Recreation events"""
 
+    # Equivalent to the CSS selector '.civic-alert-item, .event-item, article'
+    _SELECTOR = etree.XPath(f"//*[{_has_class('civic-alert-item')} or {_has_class('event-item')} or self::article]")
+    _TITLE = _tag_xpath('h2 h3 h4 a', first=True)
+    _DATE = _tag_xpath('time span', 'date', 'time', first=True)
+    _PERSONALITY = ('E', 'S', 'F', 'P')
+    _VIBES = ('family-friendly', 'outdoor', 'relaxed')
+    _TAGS = ('parks', 'outdoor', 'community')
+
     def __init__(self):
         super().__init__(
             source_name="Orange County Parks",
@@ -245,69 +389,110 @@ class OrangeCountyParksParser(SourceParser):
 
     def scrape(self) -> List[Event]:
         """Scrape Orange County Parks events"""
-        soup = self.fetch_page(self.base_url)
-        if not soup:
+        # Parsed once; the JSON-LD and HTML passes both read this tree
+        tree = self.fetch_page(self.base_url)
+        if tree is None:
             return []
 
         events = []
+        now_iso = datetime.now().isoformat()
 
         # Try JSON-LD first
-        events.extend(self.extract_from_json_ld(soup))
+        events.extend(self.extract_from_json_ld(tree, now_iso))
+        seen = {self._event_key(event.name, event.date) for event in events}
+
+        # Fields shared by every event from this listing
+        base_kwargs = dict(
+            venue="Orange County Parks",
+            location=self.location,
+            time='afternoon',
+            duration='2-3 hours',
+            price=0.0,
+            priceCategory='free',
+            capacity='large',
+            image='🏞️',
+            source=self.source_name,
+            sourceUrl=self.base_url,
+            submittedAt=now_iso,
+            status='pending'
+        )
 
         # Fallback: Parse HTML structure
         # Orange County uses various div structures for events
-        for event_div in soup.select('.civic-alert-item, .event-item, article'):
+        for event_div in self._SELECTOR(tree):
             try:
-                title_elem = event_div.find(['h2', 'h3', 'h4', 'a'])
-                if not title_elem:
+                title_elem = _first(self._TITLE, event_div)
+                if title_elem is None:
                     continue
 
-                title = title_elem.get_text(strip=True)
-                description = event_div.get_text(strip=True)[:500]
-
-                # Try to extract date
-                date_match = re.search(r'(\w+\s+\d{1,2},?\s+\d{4})', description)
-                date_str = self.parse_date(date_match.group(1)) if date_match else None
-
+                # Most matched <article>s are nav/footer content with no date,
+                # so check for one before flattening the element's text
+                date_str = self._find_date(event_div)
                 if not date_str:
                     continue
 
+                title = _text(title_elem)
+                description = _text(event_div)[:500]
+
                 link = title_elem.get('href', self.base_url)
                 if link and not link.startswith('http'):
                     link = f"https://www.ocfl.net{link}"
 
+                # Skip listings already described by JSON-LD (or matched twice)
+                key = self._event_key(title, date_str)
+                if key in seen:
+                    continue
+                seen.add(key)
+
                 events.append(Event(
                     name=title,
-                    venue="Orange County Parks",
                     category=self._infer_category(title + ' ' + description),
                     description=description,
-                    location=self.location,
                     date=date_str,
-                    time='afternoon',
-                    duration='2-3 hours',
-                    price=0.0,
-                    priceCategory='free',
-                    capacity='large',
-                    image='🏞️',
-                    personalityTags=['E', 'S', 'F', 'P'],
-                    vibes=['family-friendly', 'outdoor', 'relaxed'],
-                    tags=['parks', 'outdoor', 'community'],
+                    personalityTags=list(self._PERSONALITY),
+                    vibes=list(self._VIBES),
+                    tags=list(self._TAGS),
                     externalLink=link,
-                    source=self.source_name,
-                    sourceUrl=self.base_url,
-                    submittedAt=datetime.now().isoformat(),
-                    status='pending'
+                    **base_kwargs
                 ))
-            except Exception as e:
-                print(f"Error parsing event: {e}")
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                logger.debug("Skipping event: %s", e)
                 continue
 
         return events
 
+    def _find_date(self, event_div) -> Optional[str]:
+        """Find an event date, preferring a dedicated date/time element"""
+        date_elem = _first(self._DATE, event_div)
+        if date_elem is not None:
+            if date_match := _DATE_IN_TEXT_RE.search(_text(date_elem, ' ')):
+                if date_str := self.parse_date(date_match.group(1)):
+                    return date_str
+
+        # Scan text nodes in order so we stop at the first date found
+        for text in _strings(event_div):
+            if date_match := _DATE_IN_TEXT_RE.search(text):
+                if date_str := self.parse_date(date_match.group(1)):
+                    return date_str
+
+        return None
+
 
 class PlazaLiveParser(SourceParser):
     """Parser for The Plaza Live events"""
 
+    # Equivalent to the CSS selector '.event, .eventlist-event, article[class*="event"]'
+    _SELECTOR = etree.XPath(
+        f"//*[{_has_class('event')} or {_has_class('eventlist-event')}"
+        " or self::article[contains(@class, 'event')]]"
+    )
+    _TITLE = _tag_xpath('h1 h2 h3 a', first=True)
+    _DATE = _tag_xpath('time span div', 'date', 'time', first=True)
+    _DESC = _tag_xpath('p div', 'description', 'excerpt', 'summary', first=True)
+    _PERSONALITY = ('E', 'N', 'F', 'P')
+    _VIBES = ('energetic', 'creative', 'social')
+    _TAGS = ('live music', 'concert', 'venue')
+
     def __init__(self):
         super().__init__(
             source_name="The Plaza Live",
@@ -317,74 +502,90 @@ class PlazaLiveParser(SourceParser):
 
     def scrape(self) -> List[Event]:
         """Scrape The Plaza Live events"""
-        soup = self.fetch_page(self.base_url)
-        if not soup:
+        # Parsed once; the JSON-LD and HTML passes both read this tree
+        tree = self.fetch_page(self.base_url)
+        if tree is None:
             return []
 
         events = []
+        now_iso = datetime.now().isoformat()
 
         # Try JSON-LD first
-        events.extend(self.extract_from_json_ld(soup))
+        events.extend(self.extract_from_json_ld(tree, now_iso))
+        seen = {self._event_key(event.name, event.date) for event in events}
+
+        # Fields shared by every event from this listing
+        base_kwargs = dict(
+            venue="The Plaza Live",
+            category='music',
+            location=self.location,
+            time='20:00',
+            duration='2-3 hours',
+            capacity='medium',
+            image='🎸',
+            source=self.source_name,
+            sourceUrl=self.base_url,
+            submittedAt=now_iso,
+            status='pending'
+        )
 
         # Fallback: Parse event listings
-        for event_elem in soup.select('.event, .eventlist-event, article[class*="event"]'):
+        for event_elem in self._SELECTOR(tree):
             try:
-                title_elem = event_elem.find(['h2', 'h3', 'h1', 'a'])
-                if not title_elem:
+                title_elem = _first(self._TITLE, event_elem)
+                if title_elem is None:
                     continue
 
-                title = title_elem.get_text(strip=True)
-
-                # Extract description
-                desc_elem = event_elem.find(['p', 'div'], class_=re.compile(r'description|excerpt|summary'))
-                description = desc_elem.get_text(strip=True)[:500] if desc_elem else title
-
-                # Extract date
-                date_elem = event_elem.find(['time', 'span', 'div'], class_=re.compile(r'date|time'))
+                # Extract date first; cards without one are skipped before
+                # any of their text is materialized
+                date_elem = _first(self._DATE, event_elem)
                 date_str = None
-                if date_elem:
-                    date_str = self.parse_date(date_elem.get_text())
+                if date_elem is not None:
+                    date_str = self.parse_date(''.join(_TEXT_XPATH(date_elem)))
                     if not date_str and date_elem.get('datetime'):
                         date_str = self.parse_date(date_elem.get('datetime'))
 
                 if not date_str:
                     continue
 
-                # Extract price
-                price_elem = event_elem.find(text=re.compile(r'\$\d+'))
-                price = self.extract_price(price_elem) if price_elem else 25.0
+                title = _text(title_elem)
+
+                # Extract description
+                desc_elem = _first(self._DESC, event_elem)
+                description = _text(desc_elem)[:500] if desc_elem is not None else title
+
+                # Extract price with one search over the card's joined text
+                # rather than regex-testing every text node in the subtree
+                price_match = _DOLLAR_RE.search(_text(event_elem, ' '))
+                price = self.extract_price(price_match.group(0)) if price_match else 25.0
 
                 # Extract link
-                link_elem = event_elem.find('a', href=True)
-                link = link_elem['href'] if link_elem else self.base_url
+                link_elem = _first(_LINK_XPATH, event_elem)
+                link = link_elem.get('href') if link_elem is not None else self.base_url
                 if link and not link.startswith('http'):
                     link = f"https://plazaliveorlando.com{link}"
 
+                # Skip listings already described by JSON-LD (or matched twice)
+                key = self._event_key(title, date_str)
+                if key in seen:
+                    continue
+                seen.add(key)
+
                 events.append(Event(
                     name=title,
-                    venue="The Plaza Live",
-                    category='music',
                     description=description,
-                    location=self.location,
                     date=date_str,
-                    time='20:00',
-                    duration='2-3 hours',
                     price=price,
                     priceCategory=self.categorize_price(price),
-                    capacity='medium',
-                    image='🎸',
-                    personalityTags=['E', 'N', 'F', 'P'],
-                    vibes=['energetic', 'creative', 'social'],
-                    tags=['live music', 'concert', 'venue'],
+                    personalityTags=list(self._PERSONALITY),
+                    vibes=list(self._VIBES),
+                    tags=list(self._TAGS),
                     externalLink=link,
-                    source=self.source_name,
-                    sourceUrl=self.base_url,
-                    submittedAt=datetime.now().isoformat(),
-                    status='pending',
-                    artists=title
+                    artists=title,
+                    **base_kwargs
                 ))
-            except Exception as e:
-                print(f"Error parsing event: {e}")
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                logger.debug("Skipping event: %s", e)
                 continue
 
         return events
@@ -393,6 +594,16 @@ class PlazaLiveParser(SourceParser):
 class BeachamSocialParser(SourceParser):
     """Parser for The Beacham & The Social events"""
 
+    # Equivalent to the CSS selector '.event, .list-view-item, .rhino-event-item'
+    _SELECTOR = etree.XPath(
+        f"//*[{_has_class('event')} or {_has_class('list-view-item')} or {_has_class('rhino-event-item')}]"
+    )
+    _TITLE = _tag_xpath('h2 h3 a', first=True)
+    _DATE = _tag_xpath('time span', 'date', first=True)
+    _PERSONALITY = ('E', 'N', 'T', 'P')
+    _VIBES = ('energetic', 'nightlife', 'social')
+    _TAGS = ('live music', 'nightlife', 'downtown')
+
     def __init__(self):
         super().__init__(
             source_name="The Beacham & The Social",
@@ -402,73 +613,88 @@ class BeachamSocialParser(SourceParser):
 
     def scrape(self) -> List[Event]:
         """Scrape The Beacham & The Social events"""
-        soup = self.fetch_page(self.base_url)
-        if not soup:
+        # Parsed once; the JSON-LD and HTML passes both read this tree
+        tree = self.fetch_page(self.base_url)
+        if tree is None:
             return []
 
         events = []
+        now_iso = datetime.now().isoformat()
 
         # Try JSON-LD first
-        events.extend(self.extract_from_json_ld(soup))
+        events.extend(self.extract_from_json_ld(tree, now_iso))
+        seen = {self._event_key(event.name, event.date) for event in events}
+
+        # Fields shared by every event from this listing
+        base_kwargs = dict(
+            category='music',
+            location=self.location,
+            time='21:00',
+            duration='3-4 hours',
+            capacity='large',
+            image='🎤',
+            source=self.source_name,
+            sourceUrl=self.base_url,
+            submittedAt=now_iso,
+            status='pending'
+        )
 
         # Parse event listings (similar structure to Plaza Live)
-        for event_elem in soup.select('.event, .list-view-item, .rhino-event-item'):
+        for event_elem in self._SELECTOR(tree):
             try:
-                title_elem = event_elem.find(['h2', 'h3', 'a'])
-                if not title_elem:
+                title_elem = _first(self._TITLE, event_elem)
+                if title_elem is None:
                     continue
 
-                title = title_elem.get_text(strip=True)
-
-                # Determine venue from title or class
-                venue = "The Beacham"
-                if 'social' in title.lower() or 'the-social' in str(event_elem.get('class', [])):
-                    venue = "The Social"
-
                 # Extract date
-                date_elem = event_elem.find(['time', 'span'], class_=re.compile(r'date'))
+                date_elem = _first(self._DATE, event_elem)
                 date_str = None
-                if date_elem:
-                    date_str = self.parse_date(date_elem.get_text())
+                if date_elem is not None:
+                    date_str = self.parse_date(''.join(_TEXT_XPATH(date_elem)))
 
                 if not date_str:
                     continue
 
-                # Extract price
-                price_elem = event_elem.find(text=re.compile(r'\$\d+'))
-                price = self.extract_price(price_elem) if price_elem else 20.0
+                title = _text(title_elem)
+
+                # Determine venue from title or class
+                venue = "The Beacham"
+                if 'social' in title.lower() or 'the-social' in (event_elem.get('class') or ''):
+                    venue = "The Social"
+
+                # Extract price with one search over the card's joined text
+                # rather than regex-testing every text node in the subtree
+                price_match = _DOLLAR_RE.search(_text(event_elem, ' '))
+                price = self.extract_price(price_match.group(0)) if price_match else 20.0
 
                 # Extract link
-                link_elem = event_elem.find('a', href=True)
-                link = link_elem['href'] if link_elem else self.base_url
+                link_elem = _first(_LINK_XPATH, event_elem)
+                link = link_elem.get('href') if link_elem is not None else self.base_url
                 if link and not link.startswith('http'):
                     link = f"https://thebeacham.com{link}"
 
+                # Skip listings already described by JSON-LD (or matched twice)
+                key = self._event_key(title, date_str)
+                if key in seen:
+                    continue
+                seen.add(key)
+
                 events.append(Event(
                     name=title,
                     venue=venue,
-                    category='music',
                     description=f"Live music event at {venue}",
-                    location=self.location,
                     date=date_str,
-                    time='21:00',
-                    duration='3-4 hours',
                     price=price,
                     priceCategory=self.categorize_price(price),
-                    capacity='large',
-                    image='🎤',
-                    personalityTags=['E', 'N', 'T', 'P'],
-                    vibes=['energetic', 'nightlife', 'social'],
-                    tags=['live music', 'nightlife', 'downtown'],
+                    personalityTags=list(self._PERSONALITY),
+                    vibes=list(self._VIBES),
+                    tags=list(self._TAGS),
                     externalLink=link,
-                    source=self.source_name,
-                    sourceUrl=self.base_url,
-                    submittedAt=datetime.now().isoformat(),
-                    status='pending',
-                    artists=title
+                    artists=title,
+                    **base_kwargs
                 ))
-            except Exception as e:
-                print(f"Error parsing event: {e}")
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                logger.debug("Skipping event: %s", e)
                 continue
 
         return events
@@ -477,6 +703,15 @@ class BeachamSocialParser(SourceParser):
 class MyCentralFloridaFamilyParser(SourceParser):
     """Parser for MyCentralFloridaFamily.com events"""
 
+    # Equivalent to the CSS selector 'article, .event-item, .tribe-event'
+    _SELECTOR = etree.XPath(f"//*[self::article or {_has_class('event-item')} or {_has_class('tribe-event')}]")
+    _TITLE = _tag_xpath('h2 h3 a', first=True)
+    _DATE = _tag_xpath('time span', 'date', first=True)
+    _DESC = _tag_xpath('p div', 'description', 'excerpt', first=True)
+    _PERSONALITY = ('E', 'S', 'F', 'J')
+    _VIBES = ('family-friendly', 'educational', 'fun')
+    _TAGS = ('family', 'kids', 'community')
+
     def __init__(self):
         super().__init__(
             source_name="MyCentralFloridaFamily",
@@ -486,70 +721,84 @@ class MyCentralFloridaFamilyParser(SourceParser):
 
     def scrape(self) -> List[Event]:
         """Scrape family events"""
-        soup = self.fetch_page(self.base_url)
-        if not soup:
+        # Parsed once; the JSON-LD and HTML passes both read this tree
+        tree = self.fetch_page(self.base_url)
+        if tree is None:
             return []
 
         events = []
+        now_iso = datetime.now().isoformat()
 
         # Try JSON-LD first
-        events.extend(self.extract_from_json_ld(soup))
+        events.extend(self.extract_from_json_ld(tree, now_iso))
+        seen = {self._event_key(event.name, event.date) for event in events}
+
+        # Fields shared by every event from this listing
+        base_kwargs = dict(
+            venue="Various Locations",
+            location="Central Florida",
+            time='afternoon',
+            duration='2-3 hours',
+            capacity='medium',
+            image='👨‍👩‍👧‍👦',
+            source=self.source_name,
+            sourceUrl=self.base_url,
+            submittedAt=now_iso,
+            status='pending'
+        )
 
         # Parse event articles
-        for event_elem in soup.select('article, .event-item, .tribe-event'):
+        for event_elem in self._SELECTOR(tree):
             try:
-                title_elem = event_elem.find(['h2', 'h3', 'a'])
-                if not title_elem:
+                title_elem = _first(self._TITLE, event_elem)
+                if title_elem is None:
                     continue
 
-                title = title_elem.get_text(strip=True)
-
-                # Extract description
-                desc_elem = event_elem.find(['p', 'div'], class_=re.compile(r'description|excerpt'))
-                description = desc_elem.get_text(strip=True)[:500] if desc_elem else title
-
                 # Extract date
-                date_elem = event_elem.find(['time', 'span'], class_=re.compile(r'date'))
+                date_elem = _first(self._DATE, event_elem)
                 date_str = None
-                if date_elem:
-                    date_str = self.parse_date(date_elem.get_text())
+                if date_elem is not None:
+                    date_str = self.parse_date(''.join(_TEXT_XPATH(date_elem)))
 
                 if not date_str:
                     continue
 
+                title = _text(title_elem)
+
+                # Extract description
+                desc_elem = _first(self._DESC, event_elem)
+                description = _text(desc_elem)[:500] if desc_elem is not None else title
+
                 # Extract link
-                link_elem = event_elem.find('a', href=True)
-                link = link_elem['href'] if link_elem else self.base_url
+                link_elem = _first(_LINK_XPATH, event_elem)
+                link = link_elem.get('href') if link_elem is not None else self.base_url
 
                 # Most family events are free or budget
                 price = 0.0
-                if '$' in description:
-                    price = self.extract_price(description)
+                if price_match := _DOLLAR_RE.search(description):
+                    price = self.extract_price(price_match.group(0))
+
+                # Skip listings already described by JSON-LD (or matched twice)
+                key = self._event_key(title, date_str)
+                if key in seen:
+                    continue
+                seen.add(key)
 
                 events.append(Event(
                     name=title,
-                    venue="Various Locations",
                     category=self._infer_category(title + ' ' + description),
                     description=description,
-                    location="Central Florida",
                     date=date_str,
-                    time='afternoon',
-                    duration='2-3 hours',
                     price=price,
                     priceCategory=self.categorize_price(price),
-                    capacity='medium',
-                    image='👨‍👩‍👧‍👦',
-                    personalityTags=['E', 'S', 'F', 'J'],
-                    vibes=['family-friendly', 'educational', 'fun'],
-                    tags=['family', 'kids', 'community'],
+                    personalityTags=list(self._PERSONALITY),
+                    vibes=list(self._VIBES),
+                    tags=list(self._TAGS),
                     externalLink=link,
-                    source=self.source_name,
-                    sourceUrl=self.base_url,
-                    submittedAt=datetime.now().isoformat(),
-                    status='pending'
+                    **base_kwargs
                 ))
-            except Exception as e:
-                print(f"Error parsing event: {e}")
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                logger.debug("Skipping event: %s", e)
                 continue
 
         return events
@@ -564,6 +813,12 @@ AVAILABLE_SOURCES = {
 }
 
 
+@functools.cache
+def _get_parser(source_name: str) -> SourceParser:
+    """Return the shared parser instance for a registered source"""
+    return AVAILABLE_SOURCES[source_name]()
+
+
 def scrape_source(source_name: str) -> List[Event]:
     """Scrape events from a specific source"""
     if source_name not in AVAILABLE_SOURCES:
@@ -571,30 +826,41 @@ def scrape_source(source_name: str) -> List[Event]:
         print(f"Available sources: {', '.join(AVAILABLE_SOURCES.keys())}")
         return []
 
-    parser_class = AVAILABLE_SOURCES[source_name]
-    parser = parser_class()
+    parser = _get_parser(source_name)
 
-    print(f"Scraping {parser.source_name}...")
+    _print(f"Scraping {parser.source_name}...")
     events = parser.scrape()
-    print(f"Found {len(events)} events")
-
-    # Rate limiting
-    time.sleep(2)
+    _print(f"Found {len(events)} events from {parser.source_name}")
 
     return events
 
 
 def scrape_all_sources() -> List[Event]:
-    """Scrape events from all available sources"""
-    all_events = []
+    """Scrape events from all available sources concurrently"""
+    # Each source lives on its own host, so fetches can overlap freely
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(AVAILABLE_SOURCES)) as executor:
+        futures = {
+            executor.submit(scrape_source, source_name): source_name
+            for source_name in AVAILABLE_SOURCES
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
 
-    for source_name in AVAILABLE_SOURCES.keys():
-        events = scrape_source(source_name)
-        all_events.extend(events)
+    # Keep output in registry order regardless of completion order
+    all_events = []
+    for source_name in AVAILABLE_SOURCES:
+        all_events.extend(results[source_name])
 
     return all_events
 
 
+def _write_json(output_file: str, data: Dict[str, Any]):
+    """Write pretty-printed UTF-8 JSON, using orjson when it is installed"""
+    with open(output_file, 'wb') as f:
+        f.write(dumps_indented(data))
+
+
 def save_events(events: List[Event], output_file: str):
     """Save events to JSON file in admin portal format"""
     # Convert events to dictionaries
@@ -607,8 +873,7 @@ def save_events(events: List[Event], output_file: str):
         'events': events_data
     }
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    _write_json(output_file, output)
 
     print(f"\n✅ Saved {len(events)} events to {output_file}")
     print(f"\nTo import into admin portal:")
@@ -649,8 +914,8 @@ def main():
     # List sources
     if args.list:
         print("Available event sources:")
-        for name, parser_class in AVAILABLE_SOURCES.items():
-            p = parser_class()
+        for name in AVAILABLE_SOURCES:
+            p = _get_parser(name)
             print(f"  • {name:25} - {p.source_name}")
             print(f"    {p.base_url}")
         return
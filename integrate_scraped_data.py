@@ -6,12 +6,23 @@ Converts scraped event data into the events-data.js format and optionally
 merges with existing events.
 """
 
+import functools
 import json
+import os
 import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Set, Tuple
 import logging
 
+from scraper_utils import dumps_compact, dumps_indented, json_loads
+
+# Fallback for _format_time when the ASCII "HH:MM" fast path doesn't apply
+_TIME_RE = re.compile(r'(\d{2}):(\d{2})')
+
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -56,6 +67,47 @@ class EventDataIntegrator:
         'The Social': '🎵'
     }
 
+    # Per-category inference profile, resolved with a single lookup:
+    # (personality tags, base vibes, group sizes, interactivity)
+    #
+    # Personality tags are MBTI dimensions that would enjoy the event:
+    #   E/I - social, energetic (music/sports/festival) vs quieter events
+    #   S/N - experiential (music/food/sports) vs abstract, conceptual
+    #   T/F - logical, competitive (education/sports) vs emotional, artistic
+    #   J/P - planned, structured (education/arts) vs spontaneous
+    CATEGORY_PROFILES = {
+        'music': (('E', 'S', 'F', 'P'), ('energetic', 'social'), ('solo', 'small'), 'low'),
+        'arts': (('I', 'N', 'F', 'J'), ('cultural', 'relaxed'), ('solo', 'couple'), 'low'),
+        'food': (('I', 'S', 'F', 'P'), ('casual', 'social'), ('solo', 'couple'), 'medium'),
+        'sports': (('E', 'S', 'T', 'P'), ('energetic', 'competitive'), ('solo', 'small'), 'high'),
+        'outdoor': (('I', 'N', 'F', 'P'), ('adventurous', 'relaxed'), ('solo', 'couple'), 'medium'),
+        'education': (('I', 'N', 'T', 'J'), ('educational', 'intellectual'), ('solo',), 'high'),
+        'community': (('I', 'N', 'F', 'P'), ('social', 'meaningful'), ('solo', 'small'), 'high'),
+        'family': (('I', 'N', 'F', 'P'), ('casual', 'wholesome'), ('solo', 'small'), 'high'),
+        'festival': (('E', 'N', 'F', 'P'), ('casual',), ('solo',), 'medium'),
+    }
+    DEFAULT_PROFILE = (('I', 'N', 'F', 'P'), ('casual',), ('solo',), 'medium')
+
+    # Tags that add an extra vibe
+    EDGY_TAGS = frozenset({'indie', 'alternative', 'punk'})
+    ROMANTIC_TAGS = frozenset({'romantic', 'date'})
+    PARTY_TAGS = frozenset({'party', 'dance', 'club'})
+
+    # Default duration by category
+    DURATION_MAP = {
+        'music': '2-3 hours',
+        'arts': '1-2 hours',
+        'food': '1-2 hours',
+        'sports': '2-3 hours',
+        'outdoor': '2-4 hours',
+        'education': '1-2 hours',
+        'community': '2-3 hours',
+        'family': '2-4 hours'
+    }
+
+    # Below this many events, process start-up costs more than it saves
+    PARALLEL_THRESHOLD = 5000
+
     def __init__(self, scraped_data_file: str = 'central_florida_events.json'):
         """
         Initialize the integrator.
@@ -66,12 +118,14 @@ class EventDataIntegrator:
         self.scraped_data_file = scraped_data_file
         self.scraped_events = []
         self.integrated_events = []
+        # One timestamp per run, shared by every generated artifact
+        self._run_ts = datetime.now().isoformat()
 
     def load_scraped_data(self) -> bool:
         """Load scraped event data from JSON file."""
         try:
-            with open(self.scraped_data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.scraped_data_file, 'rb') as f:
+                data = json_loads(f.read())
                 self.scraped_events = data.get('events', [])
                 logger.info(f"Loaded {len(self.scraped_events)} scraped events")
                 return True
@@ -82,66 +136,28 @@ class EventDataIntegrator:
             logger.error(f"Invalid JSON: {e}")
             return False
 
-    def infer_personality_tags(self, event: Dict) -> List[str]:
+    @classmethod
+    @functools.lru_cache(maxsize=128)
+    def _profile_for(cls, category: str, capacity: str, price_category: str,
+                     edgy: bool, romantic: bool, party: bool) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...], str]:
         """
-        Infer MBTI personality tags based on event characteristics.
+        Build the inference profile from hashable event traits.
 
-        Returns list of personality dimensions that would enjoy this event.
-        E/I (Extraversion/Introversion)
-        S/N (Sensing/Intuition)
-        T/F (Thinking/Feeling)
-        J/P (Judging/Perceiving)
+        Only a handful of trait combinations occur in practice, so results
+        are cached and the returned tuples are shared between events.
         """
-        tags = []
-
-        # E/I: Social vs Solo activities
-        category = event.get('category', '').lower()
-        capacity = event.get('capacity', 'medium')
-        if category in ['music', 'sports', 'festival'] or capacity == 'large':
-            tags.append('E')  # Extraverted - social, energetic events
-        else:
-            tags.append('I')  # Introverted - quieter, smaller events
-
-        # S/N: Concrete vs Abstract experiences
-        if category in ['music', 'food', 'sports']:
-            tags.append('S')  # Sensing - experiential, in-the-moment
-        else:
-            tags.append('N')  # Intuition - abstract, conceptual
-
-        # T/F: Logical vs Emotional appeal
-        if category in ['education', 'sports']:
-            tags.append('T')  # Thinking - logical, competitive
-        else:
-            tags.append('F')  # Feeling - emotional, artistic
+        personality, base_vibes, base_group_sizes, interactivity = cls.CATEGORY_PROFILES.get(
+            category, cls.DEFAULT_PROFILE
+        )
+        personality_tags = list(personality)
+        group_sizes = list(base_group_sizes)
 
-        # J/P: Structured vs Spontaneous
-        if category in ['education', 'arts']:
-            tags.append('J')  # Judging - planned, structured
-        else:
-            tags.append('P')  # Perceiving - spontaneous, flexible
-
-        return tags
-
-    def infer_vibes(self, event: Dict) -> List[str]:
-        """Infer event vibes based on characteristics."""
-        vibes = []
-        category = event.get('category', '').lower()
-        price_category = event.get('price_category', 'moderate')
-        tags = [t.lower() for t in event.get('tags', [])]
-
-        # Category-based vibes
-        vibe_map = {
-            'music': ['energetic', 'social'],
-            'arts': ['cultural', 'relaxed'],
-            'food': ['casual', 'social'],
-            'sports': ['energetic', 'competitive'],
-            'outdoor': ['adventurous', 'relaxed'],
-            'education': ['educational', 'intellectual'],
-            'community': ['social', 'meaningful'],
-            'family': ['casual', 'wholesome']
-        }
+        # Large events draw an extraverted crowd and suit large groups
+        if capacity == 'large':
+            personality_tags[0] = 'E'
+            group_sizes.append('large')
 
-        vibes.extend(vibe_map.get(category, ['casual']))
+        vibes = list(base_vibes)
 
         # Price-based vibes
         if price_category == 'free':
@@ -150,46 +166,70 @@ class EventDataIntegrator:
             vibes.append('upscale')
 
         # Tag-based vibes
-        if any(t in tags for t in ['indie', 'alternative', 'punk']):
+        if edgy:
             vibes.append('edgy')
-        if any(t in tags for t in ['romantic', 'date']):
+        if romantic:
             vibes.append('romantic')
-        if any(t in tags for t in ['party', 'dance', 'club']):
+        if party:
             vibes.append('party')
 
-        return list(set(vibes))[:3]  # Limit to 3 unique vibes
+        # Limit to 3 unique vibes, keeping them in the order they were added
+        vibes = list(dict.fromkeys(vibes))[:3]
 
-    def infer_group_sizes(self, event: Dict) -> List[str]:
-        """Infer suitable group sizes for the event."""
-        capacity = event.get('capacity', 'medium')
-        category = event.get('category', '').lower()
+        return tuple(personality_tags), tuple(vibes), tuple(group_sizes), interactivity
 
-        group_sizes = ['solo']  # Most events work for solo
+    @staticmethod
+    def _normalize(event: Dict) -> Tuple[str, Set[str]]:
+        """
+        Lowercase an event's category and tags, once per event.
 
-        if category in ['food', 'arts', 'outdoor']:
-            group_sizes.append('couple')
+        Every lookup keyed on them is lowercase. The scraped event itself is
+        left as is; tags keep their case in the output, where they are shown.
+        """
+        category = event.get('category', 'music')
+        category = category.lower() if category else ''
+        return category, {t.lower() for t in event.get('tags', [])}
+
+    def _lookup_profile(self, event: Dict, category: str,
+                        tags: Set[str]) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...], str]:
+        """Reduce an event to its inference traits and fetch the cached profile."""
+        return self._profile_for(
+            category,
+            event.get('capacity', 'medium'),
+            event.get('price_category', 'moderate'),
+            not self.EDGY_TAGS.isdisjoint(tags),
+            not self.ROMANTIC_TAGS.isdisjoint(tags),
+            not self.PARTY_TAGS.isdisjoint(tags),
+        )
+
+    def infer_profile(self, event: Dict) -> Tuple[List[str], List[str], List[str], str]:
+        """
+        Infer personality tags, vibes, group sizes and interactivity at once.
 
-        if category in ['music', 'sports', 'community', 'family']:
-            group_sizes.append('small')
+        The category profile is looked up once and then adjusted for the
+        event's capacity, price category and tags.
 
-        if capacity == 'large':
-            group_sizes.append('large')
+        Returns:
+            Tuple of (personality tags, vibes, group sizes, interactivity)
+        """
+        personality_tags, vibes, group_sizes, interactivity = self._lookup_profile(event, *self._normalize(event))
+        return list(personality_tags), list(vibes), list(group_sizes), interactivity
 
-        return group_sizes
+    def infer_personality_tags(self, event: Dict) -> List[str]:
+        """Infer MBTI personality tags based on event characteristics."""
+        return self.infer_profile(event)[0]
 
-    def infer_interactivity(self, event: Dict) -> str:
-        """Infer event interactivity level."""
-        category = event.get('category', '').lower()
+    def infer_vibes(self, event: Dict) -> List[str]:
+        """Infer event vibes based on characteristics."""
+        return self.infer_profile(event)[1]
 
-        high_interactivity = ['sports', 'education', 'family', 'community']
-        low_interactivity = ['arts', 'music']
+    def infer_group_sizes(self, event: Dict) -> List[str]:
+        """Infer suitable group sizes for the event."""
+        return self.infer_profile(event)[2]
 
-        if category in high_interactivity:
-            return 'high'
-        elif category in low_interactivity:
-            return 'low'
-        else:
-            return 'medium'
+    def infer_interactivity(self, event: Dict) -> str:
+        """Infer event interactivity level."""
+        return self.infer_profile(event)[3]
 
     def convert_event(self, event: Dict, event_id: int) -> Dict:
         """
@@ -204,31 +244,18 @@ class EventDataIntegrator:
         """
         # Get emoji for the event
         venue = event.get('venue', '')
-        category = event.get('category', 'music')
+        category, tags = self._normalize(event)
         emoji = self.VENUE_EMOJIS.get(venue, self.CATEGORY_EMOJIS.get(category, '🎉'))
 
         # Convert price
         price_numeric = event.get('price_numeric', 0)
         price = int(price_numeric) if price_numeric else 0
 
-        # Infer missing fields
-        personality_tags = self.infer_personality_tags(event)
-        vibes = self.infer_vibes(event)
-        group_sizes = self.infer_group_sizes(event)
-        interactivity = self.infer_interactivity(event)
+        # Infer missing fields (shared, read-only tuples; serialized as arrays)
+        personality_tags, vibes, group_sizes, interactivity = self._lookup_profile(event, category, tags)
 
         # Determine duration (default based on category)
-        duration_map = {
-            'music': '2-3 hours',
-            'arts': '1-2 hours',
-            'food': '1-2 hours',
-            'sports': '2-3 hours',
-            'outdoor': '2-4 hours',
-            'education': '1-2 hours',
-            'community': '2-3 hours',
-            'family': '2-4 hours'
-        }
-        duration = duration_map.get(category, '2-3 hours')
+        duration = self.DURATION_MAP.get(category, '2-3 hours')
 
         # Build converted event
         converted = {
@@ -263,52 +290,90 @@ class EventDataIntegrator:
         if not time_str:
             return ''
 
-        # If already in HH:MM format, convert to 12-hour with AM/PM
-        match = re.match(r'(\d{2}):(\d{2})', time_str)
-        if match:
-            hour = int(match.group(1))
-            minute = int(match.group(2))
-
-            am_pm = 'AM' if hour < 12 else 'PM'
-            display_hour = hour if hour <= 12 else hour - 12
-            if display_hour == 0:
-                display_hour = 12
+        # If already in HH:MM format, convert to 12-hour with AM/PM.
+        # Plain ASCII "HH:MM" is checked by slicing; the regex only handles
+        # whatever that fast path rejects.
+        if (len(time_str) >= 5 and time_str[2] == ':'
+                and time_str[:2].isascii() and time_str[:2].isdigit()
+                and time_str[3:5].isascii() and time_str[3:5].isdigit()):
+            hour, minute = int(time_str[:2]), int(time_str[3:5])
+        elif match := _TIME_RE.match(time_str):
+            hour, minute = int(match.group(1)), int(match.group(2))
+        else:
+            return time_str
 
-            return f"{display_hour}:{minute:02d} {am_pm}"
+        am_pm = 'PM' if hour >= 12 else 'AM'
+        display_hour = (hour + 11) % 12 + 1
 
-        return time_str
+        return f"{display_hour}:{minute:02d} {am_pm}"
 
     def integrate_events(self, start_id: int = 1000) -> List[Dict]:
         """
         Integrate scraped events with proper formatting.
 
+        Large dumps are converted in worker processes (see
+        PARALLEL_THRESHOLD); smaller ones in this process.
+
         Args:
             start_id: Starting ID for scraped events (to avoid conflicts)
 
         Returns:
             List of integrated events
         """
-        self.integrated_events = []
-        current_id = start_id
+        if len(self.scraped_events) >= self.PARALLEL_THRESHOLD and (os.cpu_count() or 1) > 1:
+            self.integrated_events = self._convert_in_processes(self.scraped_events, start_id)
+        else:
+            self.integrated_events = self._convert_batch(self.scraped_events, start_id)
 
-        for event in self.scraped_events:
+        logger.info(f"Successfully integrated {len(self.integrated_events)} events")
+        return self.integrated_events
+
+    def _convert_batch(self, events: List[Dict], start_id: int) -> List[Dict]:
+        """Convert a batch of scraped events, skipping invalid ones."""
+        # Fill a presized list through local aliases; the loop runs once per
+        # scraped event, so attribute lookups are hoisted out of it
+        out = [None] * len(events)
+        convert = self.convert_event
+        warn = logger.warning
+        error = logger.error
+        idx = 0
+
+        for event in events:
             try:
                 # Skip events with missing required fields
                 if not event.get('name') or not event.get('date'):
-                    logger.warning(f"Skipping event with missing required fields: {event.get('name', 'Unknown')}")
+                    warn(f"Skipping event with missing required fields: {event.get('name', 'Unknown')}")
                     continue
 
                 # Convert event
-                converted = self.convert_event(event, current_id)
-                self.integrated_events.append(converted)
-                current_id += 1
+                out[idx] = convert(event, start_id + idx)
+                idx += 1
 
             except Exception as e:
-                logger.error(f"Error converting event {event.get('name', 'Unknown')}: {e}")
+                error(f"Error converting event {event.get('name', 'Unknown')}: {e}")
                 continue
 
-        logger.info(f"Successfully integrated {len(self.integrated_events)} events")
-        return self.integrated_events
+        del out[idx:]
+        return out
+
+    def _convert_in_processes(self, events: List[Dict], start_id: int) -> List[Dict]:
+        """
+        Convert events across a process pool, preserving order and IDs.
+
+        Each worker converts a contiguous chunk with _convert_batch; IDs are
+        then reassigned so they match what a single-process run produces.
+        """
+        workers = os.cpu_count() or 1
+        size = max(1, len(events) // (4 * workers))
+        chunks = [events[i:i + size] for i in range(0, len(events), size)]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            out = [event for batch in executor.map(_convert_batch_in_worker, chunks)
+                   for event in batch]
+
+        for event_id, event in enumerate(out, start_id):
+            event['id'] = event_id
+        return out
 
     def save_as_javascript(self, output_file: str = 'scraped-events.js'):
         """Save integrated events as JavaScript file."""
@@ -316,51 +381,26 @@ class EventDataIntegrator:
             logger.warning("No events to save")
             return
 
-        # Generate JavaScript file content
-        js_content = "// Auto-scraped Central Florida Events\n"
-        js_content += f"// Generated: {datetime.now().isoformat()}\n"
-        js_content += f"// Total Events: {len(self.integrated_events)}\n\n"
-        js_content += "const SCRAPED_EVENTS = [\n"
-
-        for i, event in enumerate(self.integrated_events):
-            js_content += "    {\n"
-            for key, value in event.items():
-                if isinstance(value, str):
-                    # Escape quotes in strings
-                    escaped_value = value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
-                    js_content += f'        {key}: "{escaped_value}",\n'
-                elif isinstance(value, list):
-                    # Handle arrays
-                    if all(isinstance(item, str) for item in value):
-                        items = '", "'.join(value)
-                        js_content += f'        {key}: ["{items}"],\n'
-                    else:
-                        js_content += f'        {key}: {json.dumps(value)},\n'
-                elif isinstance(value, (int, float)):
-                    js_content += f'        {key}: {value},\n'
-                elif isinstance(value, bool):
-                    js_content += f'        {key}: {str(value).lower()},\n'
-                else:
-                    js_content += f'        {key}: {json.dumps(value)},\n'
-
-            # Remove trailing comma from last property
-            js_content = js_content.rstrip(',\n') + '\n'
-            js_content += "    }"
-
-            if i < len(self.integrated_events) - 1:
-                js_content += ","
-
-            js_content += "\n"
-
-        js_content += "];\n\n"
-        js_content += "// Export for use in app\n"
-        js_content += "if (typeof module !== 'undefined' && module.exports) {\n"
-        js_content += "    module.exports = SCRAPED_EVENTS;\n"
-        js_content += "}\n"
-
-        # Save to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(js_content)
+        # A JSON array is a valid JavaScript expression, so the whole list is
+        # serialized by the JSON encoder in one call
+        header = (
+            "// Auto-scraped Central Florida Events\n"
+            f"// Generated: {self._run_ts}\n"
+            f"// Total Events: {len(self.integrated_events)}\n\n"
+            "const SCRAPED_EVENTS = "
+        )
+        footer = (
+            ";\n\n"
+            "// Export for use in app\n"
+            "if (typeof module !== 'undefined' && module.exports) {\n"
+            "    module.exports = SCRAPED_EVENTS;\n"
+            "}\n"
+        )
+
+        # Assemble the file as bytes so the encoder output is written as-is
+        Path(output_file).write_bytes(
+            header.encode('utf-8') + dumps_indented(self.integrated_events) + footer.encode('utf-8')
+        )
 
         logger.info(f"Saved {len(self.integrated_events)} events to {output_file}")
 
@@ -370,14 +410,19 @@ class EventDataIntegrator:
             logger.warning("No events to save")
             return
 
-        data = {
-            'generated_at': datetime.now().isoformat(),
+        # Compact JSON with one event per line, written event by event so
+        # the whole document is never encoded into a single buffer
+        header = dumps_compact({
+            'generated_at': self._run_ts,
             'total_events': len(self.integrated_events),
-            'events': self.integrated_events
-        }
-
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        })
+        with open(output_file, 'wb') as f:
+            f.write(header[:-1] + b',"events":[\n')
+            last = len(self.integrated_events) - 1
+            for i, event in enumerate(self.integrated_events):
+                f.write(dumps_compact(event))
+                f.write(b',\n' if i < last else b'\n')
+            f.write(b']}\n')
 
         logger.info(f"Saved {len(self.integrated_events)} events to {output_file}")
 
@@ -386,37 +431,38 @@ class EventDataIntegrator:
         if not self.integrated_events:
             return {}
 
-        stats = {
-            'total_events': len(self.integrated_events),
-            'by_category': {},
-            'by_venue': {},
-            'by_price_category': {},
-            'date_range': {'earliest': None, 'latest': None}
-        }
+        by_category = Counter()
+        by_venue = Counter()
+        by_price_category = Counter()
+        earliest = latest = None
 
-        dates = []
         for event in self.integrated_events:
-            # Count by category
-            category = event.get('category', 'unknown')
-            stats['by_category'][category] = stats['by_category'].get(category, 0) + 1
+            by_category[event.get('category', 'unknown')] += 1
+            by_venue[event.get('venue', 'unknown')] += 1
+            by_price_category[event.get('priceCategory', 'unknown')] += 1
+
+            # Track the date range in the same pass (ISO dates sort lexically)
+            date = event.get('date')
+            if date:
+                if earliest is None or date < earliest:
+                    earliest = date
+                if latest is None or date > latest:
+                    latest = date
 
-            # Count by venue type
-            venue = event.get('venue', 'unknown')
-            stats['by_venue'][venue] = stats['by_venue'].get(venue, 0) + 1
-
-            # Count by price category
-            price_cat = event.get('priceCategory', 'unknown')
-            stats['by_price_category'][price_cat] = stats['by_price_category'].get(price_cat, 0) + 1
+        stats = {
+            'total_events': len(self.integrated_events),
+            'by_category': dict(by_category),
+            'by_venue': dict(by_venue),
+            'by_price_category': dict(by_price_category),
+            'date_range': {'earliest': earliest, 'latest': latest}
+        }
 
-            # Track dates
-            if event.get('date'):
-                dates.append(event['date'])
+        return stats
 
-        if dates:
-            stats['date_range']['earliest'] = min(dates)
-            stats['date_range']['latest'] = max(dates)
 
-        return stats
+def _convert_batch_in_worker(events: List[Dict]) -> List[Dict]:
+    """Process-pool entry point: convert one chunk of scraped events."""
+    return EventDataIntegrator()._convert_batch(events, 0)
 
 
 def main():
@@ -18,50 +18,65 @@ The script will:
 """
 
 import requests
+from requests.utils import DEFAULT_ACCEPT_ENCODING
 import sys
 import argparse
+from contextlib import nullcontext
 from datetime import datetime
-
-
-def fetch_html(url: str, output_file: str = 'scraped_html.txt') -> str:
+from typing import Optional
+
+# Headers that mimic a browser, built once at import
+HEADERS = {
+    'User-Agent': 'CentralFloridaEventsBot/1.0 (+https://github.com/technical-communicator/Central-Florida-Events)',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    # Only advertise what urllib3 can decode here (br needs brotli)
+    'Accept-Encoding': DEFAULT_ACCEPT_ENCODING,
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+# Size of each chunk streamed from the response to disk
+CHUNK_SIZE = 64 * 1024
+PREVIEW_LENGTH = 500
+
+
+def fetch_html(url: str, output_file: str = 'scraped_html.txt',
+               session: Optional[requests.Session] = None) -> int:
     """
-    Fetch HTML from a URL and save it to a file.
+    Fetch HTML from a URL and stream it to a file.
 
     Args:
         url: The URL to fetch
         output_file: File to save the HTML to
+        session: Optional session to reuse connections across several URLs
 
     Returns:
-        The HTML content as a string
+        Number of bytes of HTML written
     """
     try:
         print(f"Fetching HTML from: {url}")
         print("-" * 60)
 
-        # Set up headers to mimic a browser
-        headers = {
-            'User-Agent': 'CentralFloridaEventsBot/1.0 (+https://github.com/technical-communicator/Central-Florida-Events)',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
-
-        # Fetch the page
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-
-        html_content = response.text
-
-        # Save to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(f"<!-- Scraped from: {url} -->\n")
-            f.write(f"<!-- Scraped at: {datetime.now().isoformat()} -->\n")
-            f.write(html_content)
-
-        print(f"✓ Successfully fetched HTML ({len(html_content)} characters)")
+        with requests.Session() if session is None else nullcontext(session) as http:
+            # Stream the body straight to disk instead of holding it in memory
+            response = http.get(url, headers=HEADERS, stream=True, timeout=30)
+            response.raise_for_status()
+
+            # Write the raw bytes; the page is never decoded to text on the way
+            length = 0
+            preview = b''
+            with open(output_file, 'wb') as f:
+                f.write(f"<!-- Scraped from: {url} -->\n".encode())
+                f.write(f"<!-- Scraped at: {datetime.now().isoformat()} -->\n".encode())
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    if len(preview) < PREVIEW_LENGTH:
+                        preview += chunk[:PREVIEW_LENGTH - len(preview)]
+                    length += len(chunk)
+                    f.write(chunk)
+
+        print(f"✓ Successfully fetched HTML ({length} bytes)")
         print(f"✓ Saved to: {output_file}")
         print("-" * 60)
         print("\nInstructions:")
@@ -71,12 +86,12 @@ def fetch_html(url: str, output_file: str = 'scraped_html.txt') -> str:
         print("4. Copy the contents of 'scraped_html.txt' and paste into the 'HTML Source' field")
         print("5. Click 'Parse Events' to extract events")
         print("-" * 60)
-        print("\nHTML Preview (first 500 characters):")
-        print(html_content[:500])
+        print("\nHTML Preview (first 500 bytes):")
+        print(preview.decode('utf-8', errors='replace'))
         print("...")
         print("-" * 60)
 
-        return html_content
+        return length
 
     except requests.RequestException as e:
         print(f"✗ Error fetching URL: {e}")
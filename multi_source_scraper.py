@@ -13,18 +13,27 @@ Supported Sources:
 """
 
 import requests
-from bs4 import BeautifulSoup
-import json
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from lxml import etree
 import csv
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Iterator, Optional, Any, Tuple
+import functools
 import logging
-import time
 import re
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, fields
+from operator import attrgetter
 from urllib.parse import urljoin
 
+from scraper_utils import (
+    HostLimiter, build_session, cached_response, dumps_compact, json_loads, outermost_containers,
+)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -32,8 +41,153 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once at import instead of per call/per event element
+_PRICE_RE = re.compile(r'\$?\s*(\d+(?:\.\d{2})?)')
+_TIME_RE = re.compile(r'(\d{1,2}):(\d{2})\s*(AM|PM)?', re.I)
+
+# XPath for the HTML fallback, evaluated in C by lxml. Class checks are
+# case-insensitive substring matches on the class attribute
+_CLASS = "translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+_EVENT_XPATH = etree.XPath(f"//*[contains({_CLASS}, 'event')]")
+_ITEMTYPE_XPATH = etree.XPath(
+    "//*[@itemtype='https://schema.org/Event' or @itemtype='http://schema.org/Event']"
+)
+_TITLE_XPATH = etree.XPath(
+    f"(.//*[self::h2 or self::h3 or self::h4][contains({_CLASS}, 'title') or contains({_CLASS}, 'name')])[1]"
+)
+_TITLE_LINK_XPATH = etree.XPath(
+    f"(.//a[contains({_CLASS}, 'title') or contains({_CLASS}, 'name')])[1]"
+)
+_DATE_XPATH = etree.XPath(f"(.//*[self::time or self::span][contains({_CLASS}, 'date')])[1]")
+_TIME_XPATH = etree.XPath(f"(.//*[self::time or self::span][contains({_CLASS}, 'time')])[1]")
+_PRICE_XPATH = etree.XPath(f"(.//*[contains({_CLASS}, 'price') or contains({_CLASS}, 'cost')])[1]")
+_LINK_XPATH = etree.XPath("(.//a[@href])[1]")
+_DESC_XPATH = etree.XPath(
+    f"(.//*[contains({_CLASS}, 'description') or contains({_CLASS}, 'excerpt')])[1]"
+)
+# Text nodes as bs4's get_text() sees them (script/style contents excluded)
+_TEXT_XPATH = etree.XPath(".//text()[not(parent::script or parent::style)]")
+
+# Genre keyword (matched in the lowercased name/description) -> tag
+_GENRE_TAGS = {
+    'rock': 'Rock',
+    'punk': 'Punk',
+    'indie': 'Indie',
+    'hip hop': 'Hip Hop',
+    'jazz': 'Jazz',
+}
+
+# Content-Encodings urllib3 decodes transparently in this environment
+_DECODABLE_ENCODINGS = frozenset(
+    [encoding.strip() for encoding in DEFAULT_ACCEPT_ENCODING.split(',')] + ['identity']
+)
+
+# Limits the first parse of a page to its JSON-LD blocks
+_JSON_LD_STRAINER = SoupStrainer('script', type='application/ld+json')
+
+
+def _first(xpath: etree.XPath, element) -> Optional[Any]:
+    """Return the first node an XPath selects under element, or None."""
+    found = xpath(element)
+    return found[0] if found else None
+
+
+def _text(element) -> str:
+    """Concatenate an element's stripped text, like get_text(strip=True)."""
+    return ''.join(text.strip() for text in _TEXT_XPATH(element))
+
+
+def _title_of(element) -> Optional[Any]:
+    """Return the element holding an event container's name, or None."""
+    name_tag = _first(_TITLE_XPATH, element)
+    if name_tag is None:
+        name_tag = _first(_TITLE_LINK_XPATH, element)
+    return name_tag
+
+
+_SESSION_HEADERS = {
+    'User-Agent': 'CentralFloridaEventsBot/1.0 (+https://github.com/technical-communicator/Central-Florida-Events)',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Cache-Control': 'max-age=0',
+}
+
+
+# Non-ISO date shapes, each dispatched to the strptime format(s) that fit it
+_DATE_SHAPE_RE = re.compile(
+    r'(?P<us>\d{1,2}/\d{1,2}/\d{4})'                          # 01/15/2025
+    r'|(?P<month>[A-Za-z]+\s+\d{1,2},\s+\d{4})'               # January 15, 2025 / Jan 15, 2025
+    r'|(?P<iso>\d{4}-\d{1,2}-\d{1,2}(?:T\d{1,2}:\d{1,2}(?::\d{1,2})?)?)'  # unpadded ISO
+)
+_DATE_FORMATS = {
+    'us': ('%m/%d/%Y',),
+    'month': ('%B %d, %Y', '%b %d, %Y'),
+    'iso': ('%Y-%m-%d', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M'),
+}
+
+
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """Parse a date string, trying the C-level ISO 8601 parser first."""
+    # JSON-LD startDate values are ISO 8601, usually with a time and offset
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        pass
+
+    match = _DATE_SHAPE_RE.fullmatch(date_str)
+    if not match:
+        return None
+    for fmt in _DATE_FORMATS[match.lastgroup]:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_time_cached(date_str: str, time_str: str) -> Tuple[str, str, str]:
+    """
+    Parse date and time strings; memoized because listings repeat the same
+    dates and times across many events.
+
+    Returns:
+        Tuple of (date YYYY-MM-DD, time HH:MM, datetime_display)
+    """
+    date = time_ = display = ''
+
+    try:
+        date_obj = _parse_date(date_str)
+        if date_obj:
+            date = date_obj.strftime('%Y-%m-%d')
+            display = date_obj.strftime('%A, %B %d, %Y')
+
+            # Parse time if provided
+            if time_str:
+                time_match = _TIME_RE.search(time_str)
+                if time_match:
+                    hour = int(time_match.group(1))
+                    minute = int(time_match.group(2))
+                    am_pm = time_match.group(3)
 
-@dataclass
+                    if am_pm and am_pm.upper() == 'PM' and hour != 12:
+                        hour += 12
+                    elif am_pm and am_pm.upper() == 'AM' and hour == 12:
+                        hour = 0
+
+                    time_ = f"{hour:02d}:{minute:02d}"
+                    display += f" at {time_str}"
+
+    except Exception as e:
+        logger.warning(f"Error parsing date/time: {e}")
+
+    return date, time_, display
+
+
+@dataclass(slots=True)
 class Event:
     """Standardized event data structure."""
     name: str
@@ -58,53 +212,135 @@ class Event:
 
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
-        return asdict(self)
+        # Built field by field rather than via asdict(), which recurses into
+        # every value; tags is the only container and gets a shallow copy
+        return {
+            'name': self.name,
+            'venue': self.venue,
+            'category': self.category,
+            'description': self.description,
+            'location': self.location,
+            'date': self.date,
+            'time': self.time,
+            'datetime_display': self.datetime_display,
+            'price': self.price,
+            'price_numeric': self.price_numeric,
+            'price_category': self.price_category,
+            'external_link': self.external_link,
+            'source': self.source,
+            'source_url': self.source_url,
+            'scraped_at': self.scraped_at,
+            'tags': list(self.tags),
+            'artists': self.artists,
+            'capacity': self.capacity,
+            'venue_type': self.venue_type,
+        }
 
 
 class EventScraper(ABC):
     """Abstract base class for event scrapers."""
 
-    def __init__(self, delay: float = 1.0):
+    def __init__(self, delay: float = 1.0, limiter: Optional[HostLimiter] = None,
+                 session: Optional[requests.Session] = None, run_ts: Optional[str] = None,
+                 cache_enabled: bool = False):
         """
         Initialize the scraper.
 
         Args:
-            delay: Delay between requests in seconds
+            delay: Delay between requests to the same host in seconds
+            limiter: Per-host rate limiter to share with other scrapers
+            session: HTTP session to share with other scrapers
+            run_ts: scraped_at timestamp to stamp on every event of this run
+            cache_enabled: Use a local HTTP cache when creating a session
         """
         self.delay = delay
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'CentralFloridaEventsBot/1.0 (+https://github.com/technical-communicator/Central-Florida-Events)',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Cache-Control': 'max-age=0',
-        })
+        self.limiter = limiter or HostLimiter(delay)
+        self.session = session or build_session(_SESSION_HEADERS, cache_enabled=cache_enabled)
+        self._run_ts = run_ts or datetime.now().isoformat()
         self.events: List[Event] = []
 
-    def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+    def fetch_response(self, url: str) -> Optional[requests.Response]:
         """
-        Fetch and parse a webpage.
+        Fetch a webpage without parsing it.
 
         Args:
             url: URL to fetch
 
         Returns:
-            BeautifulSoup object or None if failed
+            Response (body already read) or None if failed
         """
         try:
             logger.info(f"Fetching: {url}")
-            time.sleep(self.delay)  # Be polite
-            response = self.session.get(url, timeout=30)
+            # Cached pages cost the host nothing, so only real requests wait
+            response = cached_response(self.session, url)
+            if response is None:
+                self.limiter.wait(url)  # Be polite to each host
+                response = self.session.get(url, timeout=30)
             response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
+            content_encoding = response.headers.get('Content-Encoding')
+            if content_encoding and content_encoding.lower() not in _DECODABLE_ENCODINGS:
+                logger.warning(f"Unsupported Content-Encoding {content_encoding!r} from {url}")
+            return response
         except requests.RequestException as e:
             logger.error(f"Error fetching {url}: {e}")
             return None
 
+    def parse_response(self, response: requests.Response,
+                       strainer: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """
+        Parse a fetched page, optionally building only the strained subtrees.
+
+        The response keeps its body in memory, so a page can be parsed again
+        (e.g. in full after a strained parse) without another request.
+        """
+        # Hand lxml the server-declared charset so bs4 can skip encoding
+        # sniffing; without one (requests then guesses ISO-8859-1), let
+        # the document's own <meta charset> decide
+        declared = 'charset=' in response.headers.get('Content-Type', '').lower()
+        return BeautifulSoup(response.content, 'lxml',
+                             from_encoding=response.encoding if declared else None,
+                             parse_only=strainer)
+
+    def parse_tree(self, response: requests.Response) -> lxml.html.HtmlElement:
+        """Parse a fetched page into an lxml tree for XPath extraction."""
+        declared = 'charset=' in response.headers.get('Content-Type', '').lower()
+        parser = lxml.html.HTMLParser(encoding=response.encoding) if declared else None
+        try:
+            return lxml.html.fromstring(response.content, parser=parser)
+        except etree.ParserError:  # empty document; nothing to extract
+            return lxml.html.Element('html')
+
+    def fetch_page(self, url: str, strainer: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+        """
+        Fetch and parse a webpage.
+
+        Args:
+            url: URL to fetch
+            strainer: Optional SoupStrainer limiting which elements are parsed
+
+        Returns:
+            BeautifulSoup object or None if failed
+        """
+        response = self.fetch_response(url)
+        return self.parse_response(response, strainer) if response is not None else None
+
+    def _iter_json_ld_events(self, soup: BeautifulSoup) -> Iterator[Dict]:
+        """Yield every schema.org Event object in a page's JSON-LD blocks."""
+        for script in soup.find_all('script', type='application/ld+json'):
+            if not script.string:
+                continue
+            try:
+                # str() unwraps bs4's NavigableString, which orjson rejects
+                data = json_loads(str(script.string))
+            except ValueError as e:
+                logger.debug(f"Error parsing JSON-LD: {e}")
+                continue
+
+            # Handle both single event and list of events
+            for item in data if isinstance(data, list) else [data]:
+                if isinstance(item, dict) and item.get('@type') == 'Event':
+                    yield item
+
     @abstractmethod
     def scrape(self) -> List[Event]:
         """Scrape events from the source."""
@@ -132,7 +368,7 @@ class EventScraper(ABC):
             return ("Free", 0.0)
 
         # Extract numeric price
-        price_match = re.search(r'\$?\s*(\d+(?:\.\d{2})?)', price_text)
+        price_match = _PRICE_RE.search(price_text)
         if price_match:
             numeric = float(price_match.group(1))
             return (f"${numeric:.0f}", numeric)
@@ -146,55 +382,16 @@ class EventScraper(ABC):
         Returns:
             Dict with 'date' (YYYY-MM-DD), 'time' (HH:MM), 'datetime_display'
         """
-        result = {
-            'date': '',
-            'time': '',
-            'datetime_display': ''
-        }
-
         try:
-            # Try various date formats
-            date_formats = [
-                '%Y-%m-%d',
-                '%m/%d/%Y',
-                '%B %d, %Y',
-                '%b %d, %Y',
-                '%Y-%m-%dT%H:%M:%S',
-                '%Y-%m-%dT%H:%M'
-            ]
-
-            date_obj = None
-            for fmt in date_formats:
-                try:
-                    date_obj = datetime.strptime(date_str, fmt)
-                    break
-                except ValueError:
-                    continue
-
-            if date_obj:
-                result['date'] = date_obj.strftime('%Y-%m-%d')
-                result['datetime_display'] = date_obj.strftime('%A, %B %d, %Y')
-
-                # Parse time if provided
-                if time_str:
-                    time_match = re.search(r'(\d{1,2}):(\d{2})\s*(AM|PM)?', time_str, re.IGNORECASE)
-                    if time_match:
-                        hour = int(time_match.group(1))
-                        minute = int(time_match.group(2))
-                        am_pm = time_match.group(3)
-
-                        if am_pm and am_pm.upper() == 'PM' and hour != 12:
-                            hour += 12
-                        elif am_pm and am_pm.upper() == 'AM' and hour == 12:
-                            hour = 0
-
-                        result['time'] = f"{hour:02d}:{minute:02d}"
-                        result['datetime_display'] += f" at {time_str}"
-
-        except Exception as e:
+            date, time_, display = _parse_date_time_cached(date_str, time_str)
+        except TypeError as e:  # unhashable input, e.g. a list from JSON-LD
             logger.warning(f"Error parsing date/time: {e}")
-
-        return result
+            date = time_ = display = ''
+        return {
+            'date': date,
+            'time': time_,
+            'datetime_display': display
+        }
 
 
 class WillsPubScraper(EventScraper):
@@ -222,47 +419,41 @@ class WillsPubScraper(EventScraper):
         """Scrape events from all Will's Pub venues."""
         self.events = []
 
-        for venue_slug, venue_info in self.VENUES.items():
-            logger.info(f"Scraping {venue_info['name']}...")
-            soup = self.fetch_page(venue_info['url'])
+        # Venues share a host, so the limiter still spaces their requests;
+        # threads let one venue's parsing overlap the next venue's wait
+        with ThreadPoolExecutor(max_workers=len(self.VENUES)) as executor:
+            for events in executor.map(self._scrape_venue, self.VENUES.values()):
+                self.events.extend(events)
 
-            if not soup:
-                continue
+        return self.events
 
-            # Try JSON-LD structured data first
-            events = self._extract_from_json_ld(soup, venue_info)
+    def _scrape_venue(self, venue_info: Dict) -> List[Event]:
+        """Scrape events from a single venue page."""
+        logger.info(f"Scraping {venue_info['name']}...")
+        response = self.fetch_response(venue_info['url'])
 
-            # Fallback to HTML parsing
-            if not events:
-                events = self._extract_from_html(soup, venue_info)
+        if response is None:
+            return []
 
-            self.events.extend(events)
-            logger.info(f"Found {len(events)} events at {venue_info['name']}")
+        # Try JSON-LD structured data first, parsing only those scripts
+        events = self._extract_from_json_ld(
+            self.parse_response(response, _JSON_LD_STRAINER), venue_info
+        )
 
-        return self.events
+        # Fallback to HTML parsing of the full document
+        if not events:
+            events = self._extract_from_html(self.parse_tree(response), venue_info)
+
+        logger.info(f"Found {len(events)} events at {venue_info['name']}")
+        return events
 
     def _extract_from_json_ld(self, soup: BeautifulSoup, venue_info: Dict) -> List[Event]:
         """Extract events from JSON-LD structured data."""
         events = []
-        scripts = soup.find_all('script', type='application/ld+json')
-
-        for script in scripts:
-            try:
-                data = json.loads(script.string)
-
-                # Handle both single event and list of events
-                event_list = data if isinstance(data, list) else [data]
-
-                for item in event_list:
-                    if item.get('@type') == 'Event':
-                        event = self._parse_json_ld_event(item, venue_info)
-                        if event:
-                            events.append(event)
-
-            except (json.JSONDecodeError, AttributeError) as e:
-                logger.debug(f"Error parsing JSON-LD: {e}")
-                continue
-
+        for item in self._iter_json_ld_events(soup):
+            event = self._parse_json_ld_event(item, venue_info)
+            if event:
+                events.append(event)
         return events
 
     def _parse_json_ld_event(self, data: Dict, venue_info: Dict) -> Optional[Event]:
@@ -295,12 +486,8 @@ class WillsPubScraper(EventScraper):
 
             # Determine category and tags
             tags = ['Music', 'Live Music']
-            if 'rock' in name.lower() or 'rock' in description.lower():
-                tags.append('Rock')
-            if 'punk' in name.lower() or 'punk' in description.lower():
-                tags.append('Punk')
-            if 'indie' in name.lower() or 'indie' in description.lower():
-                tags.append('Indie')
+            haystack = f"{name}\n{description}".lower()
+            tags.extend(tag for keyword, tag in _GENRE_TAGS.items() if keyword in haystack)
 
             return Event(
                 name=name,
@@ -317,7 +504,7 @@ class WillsPubScraper(EventScraper):
                 external_link=url,
                 source=venue_info['name'],
                 source_url=venue_info['url'],
-                scraped_at=datetime.now().isoformat(),
+                scraped_at=self._run_ts,
                 tags=tags,
                 artists=artists,
                 capacity='medium',
@@ -328,60 +515,41 @@ class WillsPubScraper(EventScraper):
             logger.error(f"Error parsing JSON-LD event: {e}")
             return None
 
-    def _extract_from_html(self, soup: BeautifulSoup, venue_info: Dict) -> List[Event]:
+    def _extract_from_html(self, tree: lxml.html.HtmlElement, venue_info: Dict) -> List[Event]:
         """Extract events from HTML structure (fallback method)."""
         events = []
 
-        # Look for event containers with various selectors
-        selectors = [
-            {'class_': re.compile(r'.*event.*', re.I)},
-            {'class_': re.compile(r'.*tm-event.*', re.I)},
-            {'class_': re.compile(r'.*tribe-event.*', re.I)},
-            {'itemtype': 'https://schema.org/Event'},
-            {'itemtype': 'http://schema.org/Event'}
-        ]
-
-        event_elements = []
-        for selector in selectors:
-            found = soup.find_all(attrs=selector)
-            if found:
-                event_elements = found
-                break
+        # Look for event containers: any "event" class (which also covers
+        # tm-event/tribe-event), else schema.org Event microdata
+        event_elements = outermost_containers(_EVENT_XPATH(tree) or _ITEMTYPE_XPATH(tree), _title_of)
 
-        for element in event_elements[:20]:  # Limit to first 20 events
+        for element, name_tag in event_elements[:20]:  # Limit to first 20 events
             try:
-                # Extract event name
-                name_tag = element.find(['h2', 'h3', 'h4'], class_=re.compile(r'.*title.*|.*name.*', re.I))
-                if not name_tag:
-                    name_tag = element.find(['a'], class_=re.compile(r'.*title.*|.*name.*', re.I))
-                if not name_tag:
-                    continue
-
-                name = name_tag.get_text(strip=True)
+                name = _text(name_tag)
 
                 # Extract date/time
-                date_elem = element.find(['time', 'span'], class_=re.compile(r'.*date.*', re.I))
-                date_str = date_elem.get('datetime', '') if date_elem and date_elem.get('datetime') else ''
-                if not date_str and date_elem:
-                    date_str = date_elem.get_text(strip=True)
+                date_elem = _first(_DATE_XPATH, element)
+                date_str = ''
+                if date_elem is not None:
+                    date_str = date_elem.get('datetime') or _text(date_elem)
 
-                time_elem = element.find(['time', 'span'], class_=re.compile(r'.*time.*', re.I))
-                time_str = time_elem.get_text(strip=True) if time_elem else ''
+                time_elem = _first(_TIME_XPATH, element)
+                time_str = _text(time_elem) if time_elem is not None else ''
 
                 date_time_info = self.parse_date_time(date_str, time_str)
 
                 # Extract price
-                price_elem = element.find(class_=re.compile(r'.*price.*|.*cost.*', re.I))
-                price_text = price_elem.get_text(strip=True) if price_elem else 'Free'
+                price_elem = _first(_PRICE_XPATH, element)
+                price_text = _text(price_elem) if price_elem is not None else 'Free'
                 price_display, price_numeric = self.extract_price(price_text)
 
                 # Extract URL
-                link_elem = element.find('a', href=True)
-                url = urljoin(venue_info['url'], link_elem['href']) if link_elem else venue_info['url']
+                link_elem = _first(_LINK_XPATH, element)
+                url = urljoin(venue_info['url'], link_elem.get('href')) if link_elem is not None else venue_info['url']
 
                 # Extract description
-                desc_elem = element.find(class_=re.compile(r'.*description.*|.*excerpt.*', re.I))
-                description = desc_elem.get_text(strip=True)[:500] if desc_elem else ''
+                desc_elem = _first(_DESC_XPATH, element)
+                description = _text(desc_elem)[:500] if desc_elem is not None else ''
 
                 event = Event(
                     name=name,
@@ -398,7 +566,7 @@ class WillsPubScraper(EventScraper):
                     external_link=url,
                     source=venue_info['name'],
                     source_url=venue_info['url'],
-                    scraped_at=datetime.now().isoformat(),
+                    scraped_at=self._run_ts,
                     tags=['Music', 'Live Music'],
                     capacity='medium',
                     venue_type='indoor'
@@ -423,17 +591,17 @@ class PlazaLiveScraper(EventScraper):
     def scrape(self) -> List[Event]:
         """Scrape events from The Plaza Live."""
         logger.info(f"Scraping {self.NAME}...")
-        soup = self.fetch_page(self.URL)
+        response = self.fetch_response(self.URL)
 
-        if not soup:
+        if response is None:
             return []
 
-        # Try JSON-LD first
-        events = self._extract_from_json_ld(soup)
+        # Try JSON-LD first, parsing only those scripts
+        events = self._extract_from_json_ld(self.parse_response(response, _JSON_LD_STRAINER))
 
         # Fallback to HTML
         if not events:
-            events = self._extract_from_html(soup)
+            events = self._extract_from_html(self.parse_tree(response))
 
         logger.info(f"Found {len(events)} events at {self.NAME}")
         return events
@@ -441,24 +609,13 @@ class PlazaLiveScraper(EventScraper):
     def _extract_from_json_ld(self, soup: BeautifulSoup) -> List[Event]:
         """Extract from JSON-LD structured data."""
         events = []
-        scripts = soup.find_all('script', type='application/ld+json')
-
-        for script in scripts:
-            try:
-                data = json.loads(script.string)
-                event_list = data if isinstance(data, list) else [data]
-
-                for item in event_list:
-                    if item.get('@type') == 'Event':
-                        event = self._parse_event(item)
-                        if event:
-                            events.append(event)
-            except:
-                continue
-
+        for item in self._iter_json_ld_events(soup):
+            event = self._parse_event(item)
+            if event:
+                events.append(event)
         return events
 
-    def _extract_from_html(self, soup: BeautifulSoup) -> List[Event]:
+    def _extract_from_html(self, tree: lxml.html.HtmlElement) -> List[Event]:
         """Extract from HTML structure."""
         # Implementation depends on actual site structure
         # This is a placeholder that looks for common event patterns
@@ -500,7 +657,7 @@ class PlazaLiveScraper(EventScraper):
                 external_link=url,
                 source=self.NAME,
                 source_url=self.URL,
-                scraped_at=datetime.now().isoformat(),
+                scraped_at=self._run_ts,
                 tags=['Music', 'Concert'],
                 artists=artists,
                 capacity='large',
@@ -514,17 +671,28 @@ class PlazaLiveScraper(EventScraper):
 class MultiSourceScraper:
     """Coordinates scraping from multiple sources."""
 
-    def __init__(self, delay: float = 1.5):
+    def __init__(self, delay: float = 1.5, cache_enabled: bool = False):
         """
         Initialize multi-source scraper.
 
         Args:
             delay: Delay between requests in seconds
+            cache_enabled: Serve pages fetched within the last hour from a
+                local cache (needs requests-cache)
         """
         self.delay = delay
+        # One limiter for all scrapers, so sources sharing a host still
+        # respect the delay while different hosts are fetched concurrently
+        self.limiter = HostLimiter(delay)
+        # Shared keep-alive session, so connections (and TLS handshakes) are
+        # reused across scrapers that hit the same hosts
+        self.session = build_session(_SESSION_HEADERS, cache_enabled=cache_enabled)
+        # One timestamp per run, shared by every event and the saved file
+        self._run_ts = datetime.now().isoformat()
+        shared = {'limiter': self.limiter, 'session': self.session, 'run_ts': self._run_ts}
         self.scrapers = [
-            WillsPubScraper(delay=delay),
-            PlazaLiveScraper(delay=delay),
+            WillsPubScraper(delay=delay, **shared),
+            PlazaLiveScraper(delay=delay, **shared),
             # Add more scrapers here
         ]
         self.all_events: List[Event] = []
@@ -534,28 +702,52 @@ class MultiSourceScraper:
         logger.info("Starting multi-source scraping...")
         self.all_events = []
 
+        # Sources are network-bound, so run them concurrently
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(self.scrapers)) as executor:
+            futures = {executor.submit(scraper.scrape): scraper for scraper in self.scrapers}
+            for future in as_completed(futures):
+                scraper = futures[future]
+                try:
+                    events = future.result()
+                    results[scraper] = events
+                    logger.info(f"Collected {len(events)} events from {scraper.__class__.__name__}")
+                except Exception as e:
+                    logger.error(f"Error with {scraper.__class__.__name__}: {e}")
+
+        # Keep output in scraper order regardless of completion order, and
+        # drop cross-listed duplicates (same venue, date and name). Events
+        # whose date did not parse are always kept: sharing an empty date
+        # says nothing about recurring nights or repeat shows being the same
+        seen = set()
         for scraper in self.scrapers:
-            try:
-                events = scraper.scrape()
-                self.all_events.extend(events)
-                logger.info(f"Collected {len(events)} events from {scraper.__class__.__name__}")
-            except Exception as e:
-                logger.error(f"Error with {scraper.__class__.__name__}: {e}")
-                continue
+            for event in results.get(scraper, []):
+                if event.date:
+                    key = (event.venue, event.date, event.name.strip().lower())
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                self.all_events.append(event)
 
         logger.info(f"Total events collected: {len(self.all_events)}")
         return self.all_events
 
     def save_to_json(self, filename: str = 'central_florida_events.json'):
         """Save events to JSON file."""
-        data = {
-            'scraped_at': datetime.now().isoformat(),
+        header = dumps_compact({
+            'scraped_at': self._run_ts,
             'total_events': len(self.all_events),
-            'events': [event.to_dict() for event in self.all_events]
-        }
+        })
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Write one compact event per line as we go, instead of building the
+        # whole list of dicts and encoding it in one piece
+        with open(filename, 'wb') as f:
+            f.write(header[:-1] + b',"events":[\n')
+            last = len(self.all_events) - 1
+            for i, event in enumerate(self.all_events):
+                f.write(dumps_compact(event.to_dict()))
+                f.write(b',\n' if i < last else b'\n')
+            f.write(b']}\n')
 
         logger.info(f"Saved {len(self.all_events)} events to {filename}")
 
@@ -566,16 +758,19 @@ class MultiSourceScraper:
             return
 
         with open(filename, 'w', newline='', encoding='utf-8') as f:
-            # Get all field names from the first event
-            fieldnames = list(self.all_events[0].to_dict().keys())
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-
-            writer.writeheader()
+            # Column names come straight from the dataclass definition; rows
+            # are read positionally off each event without building a dict
+            fieldnames = [field.name for field in fields(Event)]
+            row_of = attrgetter(*fieldnames)
+            tags_index = fieldnames.index('tags')
+            writer = csv.writer(f)
+
+            writer.writerow(fieldnames)
             for event in self.all_events:
-                event_dict = event.to_dict()
+                row = list(row_of(event))
                 # Convert lists to strings for CSV
-                event_dict['tags'] = ', '.join(event_dict['tags'])
-                writer.writerow(event_dict)
+                row[tags_index] = ', '.join(event.tags)
+                writer.writerow(row)
 
         logger.info(f"Saved {len(self.all_events)} events to {filename}")
 
@@ -584,38 +779,33 @@ class MultiSourceScraper:
         if not self.all_events:
             return {}
 
-        stats = {
-            'total_events': len(self.all_events),
-            'by_venue': {},
-            'by_category': {},
-            'by_price_category': {},
-            'date_range': {
-                'earliest': None,
-                'latest': None
-            }
-        }
+        by_venue = Counter()
+        by_category = Counter()
+        by_price_category = Counter()
+        earliest = latest = None
 
-        dates = []
         for event in self.all_events:
-            # Count by venue
-            venue = event.venue
-            stats['by_venue'][venue] = stats['by_venue'].get(venue, 0) + 1
-
-            # Count by category
-            category = event.category
-            stats['by_category'][category] = stats['by_category'].get(category, 0) + 1
+            by_venue[event.venue] += 1
+            by_category[event.category] += 1
+            by_price_category[event.price_category] += 1
 
-            # Count by price category
-            price_cat = event.price_category
-            stats['by_price_category'][price_cat] = stats['by_price_category'].get(price_cat, 0) + 1
-
-            # Track dates
+            # Track the date range in the same pass (ISO dates sort lexically)
             if event.date:
-                dates.append(event.date)
+                if earliest is None or event.date < earliest:
+                    earliest = event.date
+                if latest is None or event.date > latest:
+                    latest = event.date
 
-        if dates:
-            stats['date_range']['earliest'] = min(dates)
-            stats['date_range']['latest'] = max(dates)
+        stats = {
+            'total_events': len(self.all_events),
+            'by_venue': dict(by_venue),
+            'by_category': dict(by_category),
+            'by_price_category': dict(by_price_category),
+            'date_range': {
+                'earliest': earliest,
+                'latest': latest
+            }
+        }
 
         return stats
 
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Shared Scraping Helpers
+
+HTTP session setup, per-host politeness, event container selection and
+JSON (de)serialization used by the scrapers and the integrator, kept in
+one module so they cannot drift apart between scripts.
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is used without it
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:  # optional; pages are always fetched fresh without it
+    requests_cache = None
+
+logger = logging.getLogger(__name__)
+
+# On-disk HTTP cache used with cache_enabled (requires requests-cache)
+CACHE_NAME = '.scrape_cache'
+
+# orjson rejects str subclasses (bs4 NavigableString, lxml smart strings);
+# pass those through str() first
+json_loads = orjson.loads if orjson else json.loads
+
+
+def dumps_compact(value: Any) -> bytes:
+    """Serialize a value to compact UTF-8 JSON (orjson when available)."""
+    if orjson:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def dumps_indented(value: Any) -> bytes:
+    """Serialize a value to 2-space-indented UTF-8 JSON (orjson when available)."""
+    if orjson:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    return json.dumps(value, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+class HostLimiter:
+    """Spaces out successive requests to the same host."""
+
+    def __init__(self, min_interval: float = 1.0):
+        self.min_interval = min_interval
+        self._next_allowed: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str):
+        """Block until the URL's host may be contacted again."""
+        host = urlparse(url).netloc
+        # Reserve the next slot under the lock, then sleep outside it so
+        # requests to other hosts are never held up
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed.get(host, now))
+            self._next_allowed[host] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def build_session(headers: Optional[Mapping[str, str]] = None, pool_connections: int = 16,
+                  pool_maxsize: int = 16, cache_enabled: bool = False) -> requests.Session:
+    """
+    Create a keep-alive session with pooled connections and retries.
+
+    Args:
+        headers: Default headers to send with every request
+        pool_connections: Number of per-host connection pools to keep
+        pool_maxsize: Connections kept alive per host
+        cache_enabled: Serve pages fetched within the last hour from a local
+            cache (needs requests-cache), e.g. while tuning extraction
+
+    Returns:
+        Configured session
+    """
+    cached = cache_enabled and requests_cache is not None
+    if cache_enabled and not cached:
+        logger.warning("requests-cache is not installed; fetching pages without a cache")
+    if cached:
+        # Expire by age only, ignoring the server's Cache-Control, so
+        # pages marked no-cache (common on WordPress) are reused too
+        session = requests_cache.CachedSession(
+            cache_name=CACHE_NAME,
+            backend='sqlite',
+            expire_after=3600,
+        )
+    else:
+        session = requests.Session()
+
+    # Retry transient failures instead of losing a whole page
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                          max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    # Only advertise what urllib3 can decode here (br needs brotli)
+    session.headers['Accept-Encoding'] = DEFAULT_ACCEPT_ENCODING
+    session.headers.update(headers or {})
+    if cached:
+        # Harmless for a plain session, but with a cache it would make
+        # every stored page revalidate against the server
+        session.headers.pop('Cache-Control', None)
+    return session
+
+
+def cached_response(session: requests.Session, url: str) -> Optional[requests.Response]:
+    """Return an unexpired cached response for url, without any request."""
+    if requests_cache is None or not isinstance(session, requests_cache.CachedSession):
+        return None
+    response = session.get(url, only_if_cached=True)
+    # requests-cache answers a miss with a synthetic 504
+    return response if response.status_code != 504 else None
+
+
+def outermost_containers(elements: Iterable[Any],
+                         title_of: Callable[[Any], Optional[Any]]) -> List[Tuple[Any, Any]]:
+    """
+    Reduce candidate event containers to one per event.
+
+    Loose class matches ("event" and the like) also hit list wrappers
+    ("events-list") and parts of an event ("event-header", "event-date").
+    Candidates without a title are dropped, as are wrappers (candidates
+    holding another candidate with a different title); each remaining
+    title keeps its outermost candidate.
+
+    Args:
+        elements: Candidate lxml elements, in document order
+        title_of: Returns an element's title element, or None
+
+    Returns:
+        (container, title element) pairs in document order
+    """
+    titles = {}
+    for element in elements:
+        title = title_of(element)
+        if title is not None:
+            titles[element] = title
+
+    wrappers = {
+        ancestor
+        for element, title in titles.items()
+        for ancestor in element.iterancestors()
+        if titles.get(ancestor, title) is not title
+    }
+    # Document order puts ancestors first, so setdefault keeps the outermost
+    by_title = {}
+    for element, title in titles.items():
+        if element not in wrappers:
+            by_title.setdefault(title, element)
+    return [(element, title) for title, element in by_title.items()]
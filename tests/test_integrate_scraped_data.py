@@ -0,0 +1,46 @@
+"""Tests for the integrator's emoji tables and output writers."""
+
+import json
+
+from integrate_scraped_data import EventDataIntegrator
+
+EMOJIS = list(EventDataIntegrator.CATEGORY_EMOJIS.values()) + list(EventDataIntegrator.VENUE_EMOJIS.values())
+
+
+def _integrator():
+    integrator = EventDataIntegrator()
+    integrator.integrated_events = [
+        integrator.convert_event({'name': 'Show', 'date': '2025-11-15', 'venue': venue, 'category': category}, i)
+        for i, (venue, category) in enumerate(
+            [(venue, 'music') for venue in EventDataIntegrator.VENUE_EMOJIS]
+            + [('Elsewhere', category) for category in EventDataIntegrator.CATEGORY_EMOJIS]
+        )
+    ]
+    return integrator
+
+
+def test_emojis_are_real_glyphs():
+    # Mojibake turns each emoji into 6-8 Latin-1 characters; ZWJ sequences
+    # (the family emoji) are checked per joined glyph
+    for emoji in EMOJIS:
+        for glyph in emoji.split('\u200d'):
+            assert len(glyph.encode('utf-8')) <= 8
+            assert all(ord(char) > 0xFF for char in glyph)
+
+
+def test_emojis_round_trip_unescaped(tmp_path):
+    integrator = _integrator()
+    js_file = tmp_path / 'scraped-events.js'
+    json_file = tmp_path / 'integrated_events.json'
+    integrator.save_as_javascript(str(js_file))
+    integrator.save_as_json(str(json_file))
+
+    for path in (js_file, json_file):
+        text = path.read_text(encoding='utf-8')
+        assert '\\u' not in text
+        for emoji in EMOJIS:
+            assert emoji in text
+
+    images = [event['image'] for event in json.loads(json_file.read_text(encoding='utf-8'))['events']]
+    assert images == [event['image'] for event in integrator.integrated_events]
+    assert set(images) == set(EMOJIS)
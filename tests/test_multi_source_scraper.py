@@ -0,0 +1,53 @@
+"""Tests for the multi-source scraper's HTML fallback and cross-source dedupe."""
+
+import lxml.html
+
+from multi_source_scraper import Event, MultiSourceScraper, WillsPubScraper
+
+VENUE = {'name': "Will's Pub", 'url': 'https://willspub.org/tm-venue/wills-pub/', 'location': 'Orlando'}
+
+NESTED_PAGE = b'<section class="events-list">' + b''.join(
+    b'<div class="tribe-event"><div class="event-header"><h3 class="event-title">Show %d</h3></div>'
+    b'<span class="event-date">March %d, 2025</span><span class="event-price">$%d</span></div>' % (i, i + 1, i + 10)
+    for i in range(25)
+) + b'</section>'
+
+
+def test_nested_event_classes_yield_one_event_each():
+    scraper = WillsPubScraper(delay=0)
+    events = scraper._extract_from_html(lxml.html.fromstring(NESTED_PAGE), VENUE)
+
+    assert [event.name for event in events] == ['Show %d' % i for i in range(20)]
+    assert events[0].date == '2025-03-01'
+    assert events[1].price == '$11'
+
+
+class _StubScraper:
+    def __init__(self, events):
+        self.events = events
+
+    def scrape(self):
+        return self.events
+
+
+def _event(name, date, source):
+    return Event(
+        name=name, venue="Will's Pub", category='music', description='', location='Orlando',
+        date=date, time='', datetime_display='', price='Free', price_numeric=0.0,
+        price_category='free', external_link='', source=source, source_url='', scraped_at='', tags=[],
+    )
+
+
+def test_cross_listings_are_deduped_but_undated_events_kept():
+    scraper = MultiSourceScraper(delay=0)
+    scraper.scrapers = [
+        _StubScraper([_event('Open Mic', '2025-03-01', 'venue'), _event('Open Mic', '', 'venue'),
+                      _event('Open Mic', '', 'venue')]),
+        _StubScraper([_event('open mic ', '2025-03-01', 'tickets')]),
+    ]
+
+    events = scraper.scrape_all()
+
+    assert [(event.date, event.source) for event in events] == [
+        ('2025-03-01', 'venue'), ('', 'venue'), ('', 'venue'),
+    ]
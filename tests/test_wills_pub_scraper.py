@@ -0,0 +1,105 @@
+"""Tests for the Will's Pub scraper's JSON-LD and HTML extraction."""
+
+import json
+
+import lxml.html
+
+from wills_pub_scraper import WillsPubScraper
+
+GRAPH_PAGE = '''<html><head>
+<script type="application/ld+json">%s</script>
+</head><body><div class="event"><h3 class="title">HTML fallback</h3></div></body></html>''' % json.dumps({
+    '@context': 'https://schema.org',
+    '@graph': [
+        {'@type': 'WebPage', 'name': 'Events at Will\'s Pub'},
+        {'@type': 'Event', 'name': 'Graph Show', 'startDate': '2025-11-15T20:00:00',
+         'url': 'https://willspub.org/event/graph-show/', 'offers': {'price': '15'},
+         'performer': {'@type': 'PerformingGroup', 'name': 'The Band'}},
+        {'@type': 'ItemList', 'itemListElement': [
+            {'@type': 'ListItem', 'item': {'@type': 'Event', 'name': 'Nested Show',
+                                           'startDate': '2025-11-16'}},
+        ]},
+    ],
+})
+
+
+def _scrape(html):
+    scraper = WillsPubScraper(delay=0)
+    scraper.fetch_page = lambda url: lxml.html.fromstring(html)
+    return scraper.scrape_venue('wills-pub')
+
+
+def test_graph_events_are_extracted():
+    events = _scrape(GRAPH_PAGE)
+
+    assert [event.event_name for event in events] == ['Graph Show', 'Nested Show']
+    show = events[0]
+    assert show.venue == "Will's Pub"
+    assert show.date == '2025-11-15'
+    assert show.time == '20:00:00'
+    assert show.price == '$15'
+    assert show.artists == 'The Band'
+    assert show.event_url == 'https://willspub.org/event/graph-show/'
+
+
+def test_page_without_json_ld_events_uses_html():
+    page = GRAPH_PAGE.replace('"Event"', '"Thing"')
+
+    assert [event.event_name for event in _scrape(page)] == ['HTML fallback']
+
+
+TRIBE_EVENT = '''
+<article class="tribe-events-calendar-list__event">
+  <h3 class="tribe-events-calendar-list__event-title">
+    <a href="https://willspub.org/event/band-name/">
+      Band   Name
+    </a>
+  </h3>
+  <time class="tribe-events-calendar-list__event-datetime" datetime="2026-01-05">
+    <span class="tribe-event-date-start">January 5 @ 8:00 pm</span>
+      - <span class="tribe-event-time">11:00 pm</span>
+  </time>
+</article>'''
+
+
+def test_extracted_text_is_single_line():
+    event = WillsPubScraper(delay=0).extract_event_data(lxml.html.fromstring(TRIBE_EVENT), "Will's Pub")
+
+    assert event.event_name == 'Band Name'
+    assert event.date_display == 'January 5 @ 8:00 pm - 11:00 pm'
+    assert event.date == '2026-01-05'
+
+
+TRIBE_LIST_PAGE = '''<html><body>
+<div class="tribe-events-calendar-list">
+  <h2 class="tribe-events-calendar-list__month-separator">November 2025</h2>
+  <div class="tribe-events-calendar-list__event-row">
+    <div class="tribe-events-calendar-list__event-wrapper">
+      <article class="tribe-events-calendar-list__event">
+        <div class="tribe-events-calendar-list__event-header">
+          <h3 class="tribe-events-calendar-list__event-title"><a href="https://willspub.org/event/a/">Tribute Night</a></h3>
+          <p class="event-subtitle">The Headliners, Openers</p>
+        </div>
+        <div class="event-tags"><a>Rock</a><a>Punk</a></div>
+        <span class="tribe-events-c-small-cta__price">$15</span>
+      </article>
+    </div>
+  </div>
+  <div class="tribe-events-calendar-list__event-row">
+    <article class="tribe-events-calendar-list__event">
+      <h3 class="tribe-events-calendar-list__event-title"><a href="https://willspub.org/event/b/">Jazz Brunch</a></h3>
+    </article>
+  </div>
+</div>
+</body></html>'''
+
+
+def test_tribe_events_are_extracted_once_with_generic_fields():
+    events = _scrape(TRIBE_LIST_PAGE)
+
+    assert [event.event_name for event in events] == ['Tribute Night', 'Jazz Brunch']
+    tribute = events[0]
+    assert tribute.event_url == 'https://willspub.org/event/a/'
+    assert tribute.artists == 'The Headliners, Openers'
+    assert tribute.tags == ['Rock', 'Punk']
+    assert tribute.price == '$15'